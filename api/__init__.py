@@ -0,0 +1 @@
+# 파트너 앱용 JSON API (ASGI). 실행: uvicorn api.app:app
@@ -0,0 +1,197 @@
+import hashlib
+import json
+from urllib.parse import parse_qs
+
+from core.mbti import ALL_TYPES, get_theories
+from core.triage import TRIAGE_INFO, current_engine, decide
+
+# -----------------------------
+# 궁합/응급 안내 JSON API (순수 ASGI, 프레임워크 없음)
+# -----------------------------
+#   GET  /compat/{type}?k=5&theory=classic
+#                             궁합 순위 상위 k개 — 이론 × 16유형 × k(1~16) 응답을 시작할 때
+#                             바이트로 미리 만들어 두고 ETag 가 같으면 304 (theory 생략 시 기본 이론)
+#   POST /triage              {"text": "...", "loc": "..."} 또는 text/plain 본문
+#                             test.py 와 같은 엔진(current_engine)으로 분석
+#
+# 실행 예: uvicorn api.app:app --workers 1   (uvicorn 은 별도 설치)
+
+MAX_BODY = 64 * 1024
+DEFAULT_K = 5
+
+
+def _dumps(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _etag(body: bytes) -> bytes:
+    return b'"' + hashlib.sha1(body).hexdigest()[:16].encode() + b'"'
+
+
+def compat_payloads(engines):
+    # {(이론 id, 유형, k): (본문, ETag)}
+    payloads = {}
+    for tid, engine in engines.items():
+        for t in ALL_TYPES:
+            for k in range(1, len(ALL_TYPES) + 1):
+                body = _dumps({
+                    "type": t,
+                    "k": k,
+                    "theory": tid,
+                    "results": [
+                        {"type": b, "score": score, "norm": norm, "reason": reason}
+                        for b, score, norm, reason in engine.ranked(t, k)
+                    ],
+                })
+                payloads[(tid, t, k)] = (body, _etag(body))
+    return payloads
+
+
+def triage_payload(engine, text, loc=""):
+    results, emergency_hit, urgent = engine.assess(text)
+    picks, final_triage, base = decide(results, emergency_hit, urgent=urgent)
+    keywords = engine.matched_keywords(text)
+    return {
+        "triage": final_triage,
+        "label": TRIAGE_INFO[final_triage]["label"] if final_triage else None,
+        "dest": base,
+        "emergency": emergency_hit,
+        "conditions": [
+            {
+                "name": c["name"],
+                "triage": c["triage"],
+                "dept": c["dept"],
+                "first_aid": list(c["first_aid"]),
+                "simple_tip": c.get("simple_tip"),
+                "red_flags": list(c.get("red_flags", ())),
+            }
+            for c in picks
+        ],
+        "keywords": [k for k, kind in keywords if kind != "negated"],
+        "negated": [k for k, kind in keywords if kind == "negated"],
+        "loc": loc or None,
+    }
+
+
+class App:
+    def __init__(self, get_engine=current_engine, theories=None):
+        self.get_engine = get_engine
+        self.default_theory, engines = theories or get_theories()
+        self.compat = compat_payloads(engines)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        method, path = scope["method"], scope["path"]
+        if path.startswith("/compat/"):
+            if method not in ("GET", "HEAD"):
+                await _error(send, 405, "method not allowed", allow=b"GET, HEAD")
+                return
+            await self._compat(scope, send, path[len("/compat/"):])
+        elif path == "/triage":
+            if method != "POST":
+                await _error(send, 405, "method not allowed", allow=b"POST")
+                return
+            await self._triage(scope, receive, send)
+        elif path == "/healthz":
+            await _respond(send, 200, b'{"ok":true}')
+        else:
+            await _error(send, 404, "not found")
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _compat(self, scope, send, your):
+        your = your.strip("/").upper()
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        try:
+            k = int(query.get("k", [DEFAULT_K])[0])
+        except ValueError:
+            await _error(send, 400, "k must be an integer")
+            return
+        k = min(max(k, 1), len(ALL_TYPES))
+        theory = query.get("theory", [self.default_theory])[0]
+        found = self.compat.get((theory, your, k))
+        if found is None:
+            if your not in ALL_TYPES:
+                await _error(send, 404, f"unknown MBTI type: {your}")
+            else:
+                await _error(send, 404, f"unknown theory: {theory}")
+            return
+
+        body, etag = found
+        headers = [(b"etag", etag), (b"cache-control", b"public, max-age=3600")]
+        if etag in _header(scope, b"if-none-match").replace(b" ", b"").split(b","):
+            await _respond(send, 304, b"", headers)
+        else:
+            await _respond(send, 200, b"" if scope["method"] == "HEAD" else body, headers)
+
+    async def _triage(self, scope, receive, send):
+        raw = await _read_body(receive)
+        if raw is None:
+            await _error(send, 413, "body too large")
+            return
+        if _header(scope, b"content-type").startswith(b"application/json"):
+            try:
+                data = json.loads(raw)
+                text, loc = data.get("text"), data.get("loc") or ""
+            except (ValueError, AttributeError):
+                await _error(send, 400, "invalid JSON")
+                return
+        else:
+            text, loc = raw.decode("utf-8", "replace"), ""
+        if not isinstance(text, str) or not text.strip():
+            await _error(send, 422, "text is required")
+            return
+        await _respond(send, 200, _dumps(triage_payload(self.get_engine(), text, loc)))
+
+
+def _header(scope, name):
+    for k, v in scope.get("headers", ()):
+        if k == name:
+            return v
+    return b""
+
+
+async def _read_body(receive):
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+async def _respond(send, status, body, headers=()):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json; charset=utf-8"),
+            (b"content-length", str(len(body)).encode()),
+            *headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _error(send, status, message, allow=None):
+    headers = [(b"allow", allow)] if allow else []
+    await _respond(send, status, _dumps({"error": message}), headers)
+
+
+app = App()
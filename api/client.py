@@ -0,0 +1,84 @@
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+# -----------------------------
+# 서버 없이 ASGI 앱을 바로 부르는 클라이언트 (로컬 확인/부하 측정용)
+# -----------------------------
+#   from api.app import app
+#   from api.client import Client
+#   Client(app).get("/compat/ENFP?k=3").json()
+
+
+class Response:
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class Client:
+    def __init__(self, app):
+        self.app = app
+        self._loop = asyncio.new_event_loop()
+
+    def request(self, method, url, body=b"", headers=None):
+        return self._loop.run_until_complete(self.arequest(method, url, body, headers))
+
+    def get(self, url, headers=None):
+        return self.request("GET", url, headers=headers)
+
+    def post(self, url, json_body=None, text=None, headers=None):
+        headers = dict(headers or {})
+        if json_body is not None:
+            body = json.dumps(json_body, ensure_ascii=False).encode("utf-8")
+            headers.setdefault("content-type", "application/json")
+        else:
+            body = (text or "").encode("utf-8")
+            headers.setdefault("content-type", "text/plain; charset=utf-8")
+        return self.request("POST", url, body, headers)
+
+    async def arequest(self, method, url, body=b"", headers=None):
+        parts = urlsplit(url)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": parts.path,
+            "raw_path": parts.path.encode(),
+            "query_string": parts.query.encode(),
+            "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in (headers or {}).items()],
+            "client": ("127.0.0.1", 0),
+            "server": ("testserver", 80),
+        }
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if sent:
+                return {"type": "http.disconnect"}
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        out = {}
+        chunks = []
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                out["status"] = message["status"]
+                out["headers"] = {k.decode("latin-1"): v.decode("latin-1") for k, v in message["headers"]}
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return Response(out["status"], out["headers"], b"".join(chunks))
+
+    def close(self):
+        self._loop.close()
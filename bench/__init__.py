@@ -0,0 +1,20 @@
+# 성능 측정 모음: python -m bench --help
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def scratch_audit():
+    # 측정 중 눌리는 '분석하기' 가 실제 기록(data/audit.sqlite3)에 쌓이지 않게 임시 파일로 돌린다.
+    # 환경 변수라서 그 안에서 띄운 워커 프로세스도 물려받는다 → 경로를 돌려주니 워커에서 한 번 더 지정해도 된다
+    old = os.environ.get("APP_AUDIT_DB")
+    with tempfile.TemporaryDirectory(prefix="bench-audit-", ignore_cleanup_errors=True) as tmp:
+        path = os.environ["APP_AUDIT_DB"] = os.path.join(tmp, "audit.sqlite3")
+        try:
+            yield path
+        finally:
+            if old is None:
+                os.environ.pop("APP_AUDIT_DB", None)
+            else:
+                os.environ["APP_AUDIT_DB"] = old
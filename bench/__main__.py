@@ -0,0 +1,90 @@
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+
+from bench.micro import run_micro
+
+# -----------------------------
+# python -m bench [--out results.json] [--baseline base.json]
+# -----------------------------
+# 결과는 JSON 으로 남기고, 기준선(baseline)과 비교해 tolerance 이상 느려진(커진)
+# 항목이 있으면 종료 코드 1 로 끝난다 (CI 에서 회귀 감지용).
+
+# 클수록 나쁜 지표만 비교한다
+LOWER_IS_BETTER = ("_us", "_ms", "_mb", "_kb", "_bytes")
+
+
+def flatten(results, prefix=""):
+    flat = {}
+    for k, v in results.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict):
+            flat.update(flatten(v, key + "."))
+        elif isinstance(v, (int, float)) and key.endswith(LOWER_IS_BETTER):
+            flat[key] = v
+    return flat
+
+
+def compare(current, baseline, tolerance):
+    regressions = []
+    cur, base = flatten(current), flatten(baseline)
+    for key, old in base.items():
+        new = cur.get(key)
+        if new is None or old <= 0:
+            continue
+        if new > old * (1 + tolerance):
+            regressions.append((key, old, new))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MBTI/응급처치 앱 성능 측정")
+    parser.add_argument("--size", type=int, default=1000, help="합성 말뭉치 문장 수")
+    parser.add_argument("--density", type=float, default=0.3, help="문장 속 키워드 비율 (0~1)")
+    parser.add_argument("--sessions", default="1,10,100", help="동시 세션 수 목록 (빈 값이면 부하 테스트 생략)")
+    parser.add_argument("--rounds", type=int, default=5, help="세션마다 반복할 상호작용 횟수")
+    parser.add_argument("--workers", type=int, help="부하 테스트 워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--memory", type=int, default=10, help="세션당 메모리 측정에 열 세션 수 (0 이면 생략)")
+    parser.add_argument("--text-length", type=int, default=2000, help="메모리 측정 때 입력할 증상 글 길이")
+    parser.add_argument("--out", default="-", help="결과 JSON 파일 (기본: 표준출력)")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 느려짐 비율 (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    results = {
+        "meta": {"python": platform.python_version(), "machine": platform.machine(), "size": args.size, "density": args.density},
+        "micro": run_micro(args.size, args.density),
+    }
+    sessions = [int(s) for s in args.sessions.split(",") if s.strip()]
+    if sessions:
+        from bench.load import run_load  # streamlit 이 필요해서 부하 테스트 때만
+
+        results["load"] = {
+            app: {str(n): run_load(app, n, args.rounds, args.workers) for n in sessions}
+            for app in ("main", "test")
+        }
+
+    if args.memory:
+        from bench.memory import run_memory
+
+        results["memory"] = {app: run_memory(app, args.memory, args.text_length) for app in ("main", "test")}
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.out == "-":
+        print(text)
+    else:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+        for key, old, new in regressions:
+            print(f"회귀: {key} {old} → {new}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import random
+
+from core.triage import CONDITIONS, EMERGENCY_BONUS_WORDS
+
+# -----------------------------
+# 합성 증상 문장 말뭉치
+# -----------------------------
+# density = 문장 속 조각 중 사전 키워드 비율 (0이면 매칭 없는 문장만)
+
+FILLERS = [
+    "어제부터", "갑자기", "계속", "조금", "많이", "아파요", "그리고", "밤에", "자꾸",
+    "넘어졌는데", "일하다가", "운동하다", "집에서", "걱정돼요", "괜찮을까요", "잠을 못 자요",
+    "물을 마셨는데", "병원 가야 하나요", "어지러워요", "속이 안 좋아요",
+]
+
+
+def keywords():
+    words = [k for c in CONDITIONS for k in c["keywords"]]
+    return words + list(EMERGENCY_BONUS_WORDS)
+
+
+def make_corpus(size=1000, density=0.3, length=12, seed=0):
+    rnd = random.Random(seed)
+    words = keywords()
+    corpus = []
+    for _ in range(size):
+        parts = [rnd.choice(words) if rnd.random() < density else rnd.choice(FILLERS) for _ in range(length)]
+        corpus.append(" ".join(parts))
+    return corpus
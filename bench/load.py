@@ -0,0 +1,103 @@
+import os
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from bench import scratch_audit
+from bench.corpus import make_corpus
+
+# -----------------------------
+# 다중 세션 부하 테스트 (Streamlit AppTest, 헤드리스)
+# -----------------------------
+# AppTest 는 실행할 때마다 전역 Runtime 을 만들었다 지우므로 한 프로세스 안에서
+# 스레드로 동시에 돌릴 수 없다. 그래서 세션 N개를 워커 프로세스(최대 CPU 수)에
+# 나눠 담고, 각 워커는 자기 세션들을 모두 열어 둔 채 번갈아 rerun 시킨다.
+# → CPU 경쟁은 프로세스 수만큼, 메모리·캐시는 열린 세션 수만큼 실제와 비슷해진다.
+# 분석 기록은 scratch_audit() 의 임시 파일로 (워커마다 APP_AUDIT_DB 를 넘겨 준다).
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = {"main": "main.py", "test": "test.py"}
+
+
+def _mbti_steps(at, i, texts):
+    from core.mbti import ALL_TYPES
+
+    yield at.selectbox[0].set_value(ALL_TYPES[i % len(ALL_TYPES)]).run
+    yield at.slider[0].set_value(1 + i % 10).run
+    yield at.toggle[0].set_value(i % 2 == 0).run
+
+
+def _triage_steps(at, i, texts):
+    yield at.text_area[0].input(texts[i % len(texts)]).run
+    yield at.button[0].click().run
+
+
+STEPS = {"main": _mbti_steps, "test": _triage_steps}
+
+
+def _timed(fn, latencies):
+    start = time.perf_counter()
+    fn()
+    latencies.append((time.perf_counter() - start) * 1000)
+
+
+def _drive(app, sessions, rounds, seed, audit_db):
+    from streamlit.testing.v1 import AppTest
+
+    # 워커가 get_audit() 을 처음 부르기 전에 — 실제 기록 파일에 쓰지 않게
+    os.environ["APP_AUDIT_DB"] = audit_db
+
+    texts = make_corpus(50, density=0.4, length=8, seed=seed)
+    latencies = []
+    tests = []
+    for _ in range(sessions):
+        at = AppTest.from_file(str(ROOT / SCRIPTS[app]), default_timeout=60)
+        _timed(at.run, latencies)
+        tests.append(at)
+    for i in range(rounds):
+        for at in tests:
+            for step in STEPS[app](at, i, texts):
+                _timed(step, latencies)
+    return latencies, peak_rss_mb()
+
+
+def _percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = min(len(values) - 1, max(0, round(p / 100 * (len(values) - 1))))
+    return values[k]
+
+
+def peak_rss_mb():
+    # 리눅스는 KB, macOS 는 바이트 단위
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def run_load(app, sessions, rounds=5, workers=None):
+    workers = max(1, min(sessions, workers or os.cpu_count() or 1))
+    shares = [sessions // workers + (w < sessions % workers) for w in range(workers)]
+
+    start = time.perf_counter()
+    with scratch_audit() as audit_db, ProcessPoolExecutor(max_workers=workers) as pool:
+        done = list(pool.map(_drive, [app] * workers, shares, [rounds] * workers, range(workers), [audit_db] * workers))
+    elapsed = time.perf_counter() - start
+
+    latencies = [ms for lat, _ in done for ms in lat]
+    rss = [mb for _, mb in done]
+    return {
+        "sessions": sessions,
+        "workers": workers,
+        "reruns": len(latencies),
+        "p50_ms": round(_percentile(latencies, 50), 2),
+        "p95_ms": round(_percentile(latencies, 95), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+        "reruns_per_sec": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "peak_rss_mb": round(max(rss), 1),
+        "total_rss_mb": round(sum(rss), 1),
+    }
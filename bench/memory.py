@@ -0,0 +1,127 @@
+import array
+import gc
+import sys
+import tracemalloc
+import types
+from pathlib import Path
+
+from bench import scratch_audit
+from bench.corpus import make_corpus
+
+# -----------------------------
+# 세션당 메모리 (Streamlit AppTest, 헤드리스)
+# -----------------------------
+# 세션 N개를 한 프로세스에 열어 두고 세 가지를 잰다.
+#   state_bytes   세션 상태(session_state)에 남는 바이트 — 모든 세션이 같이 쓰는 사전·엔진은 빼고 센다
+#   retained_kb   세션 하나를 더 열었을 때 늘어나는 파이썬 메모리 (tracemalloc, AppTest 자체 몫 포함)
+#   rerun_peak_kb 다시 그리기 한 번에 잠깐 더 쓰는 메모리 (캐시에서 꺼내며 복사하는 것 등)
+# python -m bench --memory N — 변경 전후 비교는 --out 으로 남긴 JSON 을 --baseline 으로 넘기면 된다.
+# 분석 기록은 scratch_audit() 의 임시 파일로 간다 (실제 data/audit.sqlite3 는 건드리지 않는다).
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = {"main": "main.py", "test": "test.py"}
+
+
+def _shared_roots():
+    # 프로세스에 하나씩만 있는 것들 (세션 몫으로 세지 않는다)
+    from core.mbti import get_theories
+    from core.triage import TRIAGE_INFO, current_engine, extended_engine
+
+    return [current_engine(), extended_engine(), TRIAGE_INFO, get_theories()]
+
+
+def _children(obj):
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+    else:
+        d = getattr(obj, "__dict__", None)
+        if isinstance(d, dict):
+            yield d
+        for cls in type(obj).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(obj, name):
+                    yield getattr(obj, name)
+
+
+LEAVES = (str, bytes, bytearray, int, float, bool, type(None), array.array)
+OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def reachable(roots, skip=frozenset()):
+    # roots 에서 닿는 객체 id → 객체 (skip 에 든 id 는 들어가지 않는다)
+    seen = {}
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or id(obj) in skip or isinstance(obj, OPAQUE):
+            continue
+        seen[id(obj)] = obj
+        if not isinstance(obj, LEAVES):
+            stack.extend(_children(obj))
+    return seen
+
+
+def deep_size(obj, skip=frozenset()):
+    return sum(sys.getsizeof(o) for o in reachable([obj], skip).values())
+
+
+def _long_text(length, seed):
+    text = ""
+    for sentence in make_corpus(max(1, length // 8), density=0.4, length=8, seed=seed):
+        text += sentence + " "
+        if len(text) >= length:
+            break
+    return text[:length]
+
+
+def _steps(at, app, i, length):
+    if app == "test":
+        at.text_area[0].input(_long_text(length, seed=i)).run()
+        at.button[0].click().run()
+    else:
+        at.toggle[0].set_value(True).run()
+
+
+def run_memory(app, sessions=10, length=2000):
+    with scratch_audit():
+        return _run_memory(app, sessions, length)
+
+
+def _run_memory(app, sessions, length):
+    from streamlit.testing.v1 import AppTest
+
+    script = str(ROOT / SCRIPTS[app])
+    # 한 번 미리 돌려서 모듈 import·사전·공용 캐시를 채운다
+    warm = AppTest.from_file(script, default_timeout=60).run()
+    _steps(warm, app, 0, length)
+    skip = frozenset(reachable(_shared_roots()))
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tests, states = [], []
+    for i in range(sessions):
+        at = AppTest.from_file(script, default_timeout=60).run()
+        _steps(at, app, i, length)
+        tests.append(at)
+        states.append(deep_size(at.session_state.to_dict(), skip))
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+
+    # 이미 열린 세션에서 다시 그리기 한 번
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    tests[0].run()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    return {
+        "sessions": sessions,
+        "text_length": length if app == "test" else 0,
+        "state_bytes": round(sum(states) / len(states)),
+        "retained_kb": round(retained / sessions / 1024, 1),
+        "rerun_peak_kb": round(peak / 1024, 1),
+    }
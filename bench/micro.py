@@ -0,0 +1,42 @@
+import time
+
+from bench.corpus import make_corpus
+from core.mbti import ALL_TYPES, calc_score
+from core.triage import ENGINE, TriageEngine, normalize
+
+# -----------------------------
+# 핵심 함수 마이크로 벤치마크
+# -----------------------------
+# 각 항목은 "호출 1번당 마이크로초" 로 보고한다 (repeat 번 돌려 가장 빠른 값).
+
+
+def _best_per_call(fn, calls, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+def run_micro(size=1000, density=0.3, repeat=5):
+    corpus = make_corpus(size, density)
+    normalized = [normalize(t) for t in corpus]
+    pairs = [(a, b) for a in ALL_TYPES for b in ALL_TYPES]
+    cold = TriageEngine(ENGINE.conditions, ENGINE.emergency_words, cache=None)
+    warm = TriageEngine(ENGINE.conditions, ENGINE.emergency_words)
+    for t in corpus:
+        warm.analyze(t)
+
+    # analyze() 의 두 단계를 따로: 키워드 찾기(정확·오타·부정) / 걸린 키워드로 질환 점수 매기기
+    hits = [cold.match(t) for t in normalized]
+
+    results = {
+        "calc_score_us": _best_per_call(lambda: [calc_score(a, b) for a, b in pairs], len(pairs), repeat),
+        "normalize_us": _best_per_call(lambda: [normalize(t) for t in corpus], size, repeat),
+        "match_us": _best_per_call(lambda: [cold.match(t) for t in normalized], size, repeat),
+        "score_us": _best_per_call(lambda: [cold.score(h) for h in hits], size, repeat),
+        "analyze_cold_us": _best_per_call(lambda: [cold.analyze(t) for t in corpus], size, repeat),
+        "analyze_cached_us": _best_per_call(lambda: [warm.analyze(t) for t in corpus], size, repeat),
+    }
+    return {k: round(v, 3) for k, v in results.items()}
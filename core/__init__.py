@@ -0,0 +1,39 @@
+# 화면(Streamlit)과 분리된 공용 로직 모음
+#
+# `import core` 자체는 아무것도 불러오지 않는다. 아래 이름을 처음 꺼낼 때
+# 해당 하위 모듈을 import 하므로, 워커/스크립트에서도 필요한 만큼만 비용을 낸다.
+import importlib
+
+_EXPORTS = {
+    "ALL_TYPES": "core.mbti",
+    "GOLDEN_PAIRS": "core.mbti",
+    "LETTER_INDEX": "core.mbti",
+    "calc_score": "core.mbti",
+    "get_engine": "core.mbti",
+    "get_theories": "core.mbti",
+    "TRIAGE_INFO": "core.triage",
+    "CONDITIONS": "core.triage",
+    "EMERGENCY_BONUS_WORDS": "core.triage",
+    "TriageEngine": "core.triage",
+    "ANALYZE_CACHE": "core.triage",
+    "current_engine": "core.triage",
+    "extended_engine": "core.triage",
+    "normalize": "core.triage",
+    "analyze": "core.triage",
+    "decide": "core.triage",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,256 @@
+import atexit
+import hashlib
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+from core.triage import normalize
+
+# -----------------------------
+# 분석 기록 (품질 검토용, 추가만 가능)
+# -----------------------------
+# 버튼 처리 중에는 큐에 넣기만 하고, 백그라운드 스레드가 모아서 SQLite(WAL)에 쓴다.
+# 원문은 남기지 않고 정규화된 텍스트의 해시만 저장한다.
+#
+# audit         한 건 = 한 행 (UPDATE/DELETE 는 트리거로 막음)
+# triage_rollup 분(minute) 단위 × 우선순위별 건수. 같은 트랜잭션에서 함께 올려 두므로
+#               기간별 분포는 이 작은 표의 기본키 범위만 읽으면 된다 (audit 전체를 훑지 않음)
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DEFAULT_PATH = DATA_DIR / "audit.sqlite3"
+BUCKET_SECONDS = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    text_hash TEXT NOT NULL,
+    conditions TEXT NOT NULL,
+    triage INTEGER,
+    dept TEXT,
+    loc TEXT
+);
+CREATE INDEX IF NOT EXISTS audit_ts ON audit (ts);
+CREATE TABLE IF NOT EXISTS triage_rollup (
+    bucket INTEGER NOT NULL,
+    triage INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (bucket, triage)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS audit_no_update BEFORE UPDATE ON audit
+BEGIN SELECT RAISE(ABORT, 'audit is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS audit_no_delete BEFORE DELETE ON audit
+BEGIN SELECT RAISE(ABORT, 'audit is append-only'); END;
+"""
+
+INSERT = "INSERT INTO audit (ts, text_hash, conditions, triage, dept, loc) VALUES (?, ?, ?, ?, ?, ?)"
+# 매칭이 없던 분석은 우선순위 0 으로 집계한다
+ROLLUP = """
+INSERT INTO triage_rollup (bucket, triage, n) VALUES (?, ?, ?)
+ON CONFLICT (bucket, triage) DO UPDATE SET n = n + excluded.n
+"""
+
+
+def connect(path):
+    conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize(text).encode("utf-8")).hexdigest()[:32]
+
+
+_STOP = object()
+
+
+class AuditLog:
+    # policy: 큐가 꽉 찼을 때
+    #   "drop"  — 새 기록을 버리고 dropped 를 센다 (화면 응답을 절대 늦추지 않음)
+    #   "block" — 자리가 날 때까지 최대 block_timeout 초 기다린 뒤 그래도 없으면 버린다
+    def __init__(self, path=DEFAULT_PATH, max_queue=10_000, batch_size=256, flush_interval=1.0,
+                 policy="drop", block_timeout=1.0):
+        if policy not in ("drop", "block"):
+            raise ValueError(f"unknown policy: {policy!r}")
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.written = 0
+        self.dropped = 0
+        self.last_error = None
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._thread = threading.Thread(target=self._drain, name="audit-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, text, picks, final_triage, base, loc=""):
+        conditions = "|".join(c["name"] for c in picks)
+        row = (time.time(), text_hash(text), conditions, final_triage, base, loc.strip() or None)
+        return self.put(row)
+
+    def put(self, row):
+        if self._closed:
+            # 닫혔거나 쓰기 스레드가 죽었으면 받지 않는다 (버린 것으로 센다)
+            self.dropped += 1
+            return False
+        try:
+            if self.policy == "block":
+                self._queue.put(row, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _drain(self):
+        try:
+            conn = connect(self.path)
+        except (sqlite3.Error, OSError) as e:
+            # 열 수 없는 위치(읽기 전용 디렉터리 등): 기록만 끄고 앱은 그대로 돌아가게
+            self._fail(e)
+            return
+        try:
+            while True:
+                batch, stop = self._collect()
+                if batch:
+                    self._write(conn, batch)
+                if stop:
+                    return
+        except Exception as e:
+            self._fail(e)
+        finally:
+            conn.close()
+
+    def _fail(self, error):
+        self.last_error = error
+        self._closed = True
+        print(f"audit 기록 중단: {error}", file=sys.stderr)
+        # 이미 큐에 들어온 것은 쓸 수 없으니 버린 것으로 센다
+        while True:
+            try:
+                row = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if row is not _STOP:
+                self.dropped += 1
+
+    def _collect(self):
+        # 첫 건은 기다리고, 이후로는 batch_size 만큼 또는 flush_interval 이 지날 때까지 모은다
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                row = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if row is _STOP:
+                return batch, True
+            batch.append(row)
+        return batch, False
+
+    def _write(self, conn, batch):
+        rollup = {}
+        for ts, _, _, triage, _, _ in batch:
+            key = (int(ts) // BUCKET_SECONDS, triage or 0)
+            rollup[key] = rollup.get(key, 0) + 1
+        try:
+            with conn:
+                conn.executemany(INSERT, batch)
+                conn.executemany(ROLLUP, [(b, t, n) for (b, t), n in rollup.items()])
+            self.written += len(batch)
+        except sqlite3.Error as e:
+            # 쓰기 실패로 앱이 멈추면 안 되니 버리고 이유만 남긴다
+            self.last_error = e
+            self.dropped += len(batch)
+            print(f"audit 기록 실패 ({len(batch)}건): {e}", file=sys.stderr)
+
+    def close(self, timeout=10.0):
+        # 큐에 남은 것까지 다 쓰고 끝낸다 (atexit 에서도 불림)
+        if self._closed:
+            return
+        self._closed = True
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def triage_distribution(path=DEFAULT_PATH, since=None, until=None, window=3600):
+    # [(구간 시작 시각, {우선순위: 건수})], 우선순위 0 = 매칭 없음
+    # window 는 BUCKET_SECONDS 의 배수로 맞춘다
+    step = max(1, int(window) // BUCKET_SECONDS)
+    lo = 0 if since is None else int(since) // BUCKET_SECONDS
+    hi = sys.maxsize if until is None else int(until) // BUCKET_SECONDS
+    conn = sqlite3.connect(str(path), timeout=30)
+    try:
+        rows = conn.execute(
+            "SELECT bucket / ? AS w, triage, SUM(n) FROM triage_rollup "
+            "WHERE bucket BETWEEN ? AND ? GROUP BY w, triage ORDER BY w, triage",
+            (step, lo, hi),
+        ).fetchall()
+    finally:
+        conn.close()
+    out = {}
+    for w, triage, n in rows:
+        out.setdefault(w * step * BUCKET_SECONDS, {})[triage] = n
+    return sorted(out.items())
+
+
+_audit = None
+_audit_lock = threading.Lock()
+
+
+def get_audit() -> AuditLog:
+    # 프로세스당 하나 (모든 Streamlit 세션이 같이 씀). APP_AUDIT_DB 로 위치를 바꿀 수 있다
+    global _audit
+    if _audit is None:
+        with _audit_lock:
+            if _audit is None:
+                _audit = AuditLog(os.environ.get("APP_AUDIT_DB") or DEFAULT_PATH)
+    return _audit
+
+
+def main(argv=None):
+    import argparse
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description="기간별 우선순위 분포")
+    parser.add_argument("db", nargs="?", default=str(DEFAULT_PATH))
+    parser.add_argument("--window", type=int, default=3600, help="구간 길이 (초)")
+    parser.add_argument("--hours", type=float, help="최근 N시간만")
+    args = parser.parse_args(argv)
+
+    since = time.time() - args.hours * 3600 if args.hours else None
+    for start, counts in triage_distribution(args.db, since=since, window=args.window):
+        when = datetime.fromtimestamp(start).strftime("%Y-%m-%d %H:%M")
+        print(when, " ".join(f"{t}:{n}" for t, n in sorted(counts.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from core.triage import TRIAGE_INFO, current_engine, decide
+
+# -----------------------------
+# 대량 증상 기록 재분류 (JSONL/CSV → JSONL)
+# -----------------------------
+# 읽기 → normalize/analyze/decide → 쓰기 를 제너레이터로 이어서
+# 한 번에 메모리에 올라가는 건 처리 중인 배치 몇 개뿐이다.
+
+
+def read_records(path):
+    # JSONL 은 줄 문자열 그대로(파싱은 워커에서), CSV 는 행 dict 로 흘려보낸다. "-" 는 표준입력.
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+    try:
+        if path != "-" and Path(path).suffix.lower() == ".csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def triage_record(record, text_field="text", id_field="id"):
+    results, emergency_hit, urgent = current_engine().assess(record.get(text_field) or "")
+    picks, final_triage, base = decide(results, emergency_hit, urgent=urgent)
+    return {
+        id_field: record.get(id_field),
+        "triage": final_triage,
+        "label": TRIAGE_INFO[final_triage]["label"] if final_triage else None,
+        "dest": base,
+        "conditions": [c["name"] for c in picks],
+        "emergency": emergency_hit,
+    }
+
+
+def _check(record, text_field):
+    # 받을 수 없는 기록이면 ValueError
+    if not isinstance(record, dict):
+        raise ValueError(f"JSON 객체가 아닙니다: {type(record).__name__}")
+    text = record.get(text_field)
+    if text is not None and not isinstance(text, str):
+        raise ValueError(f"{text_field} 가 문자열이 아닙니다: {type(text).__name__}")
+
+
+def _triage_batch(batch, text_field, id_field):
+    # 워커 안에서 파싱·분류·직렬화까지 끝내고 (JSONL 덩어리, 거부 건수) 만 돌려보낸다
+    # 깨진 줄 하나 때문에 전체가 멈추지 않게, 받을 수 없는 기록은 {id, error} 한 줄로 남기고 넘어간다
+    lines = []
+    rejects = 0
+    for r in batch:
+        try:
+            if isinstance(r, str):
+                r = json.loads(r)  # JSONDecodeError 도 ValueError
+            _check(r, text_field)
+        except ValueError as e:
+            rejects += 1
+            rid = r.get(id_field) if isinstance(r, dict) else None
+            lines.append(json.dumps({id_field: rid, "error": str(e)}, ensure_ascii=False))
+            continue
+        lines.append(json.dumps(triage_record(r, text_field, id_field), ensure_ascii=False))
+    lines.append("")
+    return "\n".join(lines), rejects
+
+
+def batches(records, size):
+    it = iter(records)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def run(records, workers=0, batch_size=1000, text_field="text", id_field="id"):
+    # 배치별 (JSONL 문자열, 거부 건수, 건수) 를 yield. workers=0 이면 현재 프로세스에서,
+    # 아니면 프로세스 풀에서 처리한다 (입력 순서 유지).
+    if workers <= 0:
+        for batch in batches(records, batch_size):
+            yield *_triage_batch(batch, text_field, id_field), len(batch)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for batch in batches(records, batch_size):
+            pending.append((pool.submit(_triage_batch, batch, text_field, id_field), len(batch)))
+            # 앞서 나간 배치가 너무 많으면 결과부터 흘려보내 메모리를 묶어 둔다
+            if len(pending) >= workers * 2:
+                future, size = pending.popleft()
+                yield *future.result(), size
+        while pending:
+            future, size = pending.popleft()
+            yield *future.result(), size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="증상 기록(JSONL/CSV)을 한꺼번에 분류합니다.")
+    parser.add_argument("input", help="JSONL 또는 CSV 파일 (- 는 표준입력)")
+    parser.add_argument("-o", "--output", default="-", help="결과 JSONL (기본: 표준출력)")
+    parser.add_argument("-w", "--workers", type=int, default=0, help="프로세스 수 (0 = 단일 프로세스)")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--text-field", default="text")
+    parser.add_argument("--id-field", default="id")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    start = time.perf_counter()
+    n = rejected = 0
+    try:
+        records = read_records(args.input)
+        for chunk, rejects, size in run(records, args.workers, args.batch_size, args.text_field, args.id_field):
+            out.write(chunk)
+            n += size
+            rejected += rejects
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    rate = n / elapsed if elapsed > 0 else 0.0
+    print(f"{n}건 처리 · {rejected}건 거부 · {elapsed:.2f}초 · {rate:,.0f} records/sec", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
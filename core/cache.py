@@ -0,0 +1,83 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# -----------------------------
+# 프로세스 공용 결과 캐시 (LRU + 용량 + TTL)
+# -----------------------------
+# Streamlit 세션들은 한 프로세스 안의 스레드라서 모듈 전역 캐시 하나를 같이 쓴다.
+# 항목 수 / 대략의 바이트 수 중 하나라도 넘치면 가장 오래 안 쓴 항목부터 버리고,
+# ttl 초가 지난 항목은 꺼낼 때 만료시킨다.
+
+
+class ResultCache:
+    def __init__(self, max_entries=10_000, max_bytes=32 * 1024 * 1024, ttl=3600.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._data = OrderedDict()  # key → (만료 시각, 크기, 값)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            expires, size, value = item
+            if expires < now:
+                del self._data[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, size=None):
+        if size is None:
+            size = sys.getsizeof(key) + sys.getsizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, s, _) = self._data.popitem(last=False)
+                self._bytes -= s
+                self.evictions += 1
+
+    def discard(self, predicate):
+        # predicate(key) 가 참인 항목을 지운다 (예: 옛 버전 키)
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                self._bytes -= self._data.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+            }
@@ -0,0 +1,176 @@
+import csv
+import heapq
+import math
+from pathlib import Path
+
+from core.matcher import KeywordMatcher
+
+# -----------------------------
+# 오프라인 가까운 병원/응급실 찾기
+# -----------------------------
+# data/facilities.csv (병원: 좌표, 진료과, 응급실/야간진료 여부) 와
+# data/gazetteer.csv (동/역 이름 → 좌표) 만으로 동작한다. 외부 지도 검색 없이
+# 격자(grid) 색인에서 가까운 칸부터 넓혀 가며 조건에 맞는 곳 N 개를 찾는다.
+# 동봉된 CSV 는 예시용이며, 실제로는 공공데이터(전국 병·의원 정보)로 바꿔 쓴다.
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+CELL_DEG = 0.02  # 격자 한 칸 ≈ 2km
+EARTH_KM = 6371.0
+MAX_KM = 50.0  # 이보다 먼 곳은 "가까운 곳" 으로 안내하지 않는다
+
+
+class Facility:
+    __slots__ = ("name", "lat", "lon", "departments", "er", "night")
+
+    def __init__(self, name, lat, lon, departments, er, night):
+        self.name = name
+        self.lat = lat
+        self.lon = lon
+        self.departments = departments
+        self.er = er
+        self.night = night
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_KM * math.asin(math.sqrt(a))
+
+
+def load_facilities(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return [
+            Facility(
+                row["name"],
+                float(row["lat"]),
+                float(row["lon"]),
+                frozenset(d.strip() for d in row["departments"].split(";") if d.strip()),
+                row.get("er", "0").strip() == "1",
+                row.get("night", "0").strip() == "1",
+            )
+            for row in csv.DictReader(f)
+        ]
+
+
+class GridIndex:
+    def __init__(self, facilities, cell=CELL_DEG):
+        self.cell = cell
+        self.cells = {}
+        for f in facilities:
+            self.cells.setdefault(self._key(f.lat, f.lon), []).append(f)
+        keys = list(self.cells) or [(0, 0)]
+        # 시설이 있는 칸들의 경계 상자 — 이 밖의 칸은 볼 필요가 없다
+        self.i_lo, self.i_hi = min(k[0] for k in keys), max(k[0] for k in keys)
+        self.j_lo, self.j_hi = min(k[1] for k in keys), max(k[1] for k in keys)
+
+    def _key(self, lat, lon):
+        return int(math.floor(lat / self.cell)), int(math.floor(lon / self.cell))
+
+    def _ring(self, ci, cj, r):
+        # 시작 칸에서 체비셰프 거리 r 인 칸 중 경계 상자 안에 있는 것만 (고리 둘레 O(r))
+        i_lo, i_hi, j_lo, j_hi = self.i_lo, self.i_hi, self.j_lo, self.j_hi
+        for i in range(max(ci - r, i_lo), min(ci + r, i_hi) + 1):
+            if abs(i - ci) == r:
+                yield from ((i, j) for j in range(max(cj - r, j_lo), min(cj + r, j_hi) + 1))
+            else:
+                if j_lo <= cj - r <= j_hi:
+                    yield i, cj - r
+                if r and j_lo <= cj + r <= j_hi:
+                    yield i, cj + r
+
+    def nearest(self, lat, lon, n=5, accept=None, max_km=MAX_KM):
+        # (시작 칸에서 r 칸 떨어진 고리)를 r=0,1,2… 순서로 훑는다.
+        # r 번째 고리 밖은 최소 (r 칸) 만큼 떨어져 있으니, 이미 n 개를 모았고
+        # n 번째 거리가 그보다 가까우면 멈춘다. max_km 밖이나 경계 상자 밖까지 가면 거기서 끝.
+        ci, cj = self._key(lat, lon)
+        cell_km = self.cell * math.pi / 180 * EARTH_KM * min(1.0, math.cos(math.radians(lat)))
+        last = min(
+            math.ceil(max_km / cell_km) if cell_km > 0 else 0,
+            max(ci - self.i_lo, self.i_hi - ci, cj - self.j_lo, self.j_hi - cj, 0),
+        )
+        best = []  # (-거리, 순번, 시설) 최대 힙
+        seq = 0
+        for r in range(last + 1):
+            for key in self._ring(ci, cj, r):
+                for f in self.cells.get(key, ()):
+                    if accept is not None and not accept(f):
+                        continue
+                    d = haversine_km(lat, lon, f.lat, f.lon)
+                    if d > max_km:
+                        continue
+                    seq += 1
+                    if len(best) < n:
+                        heapq.heappush(best, (-d, seq, f))
+                    elif d < -best[0][0]:
+                        heapq.heapreplace(best, (-d, seq, f))
+            if len(best) == n and -best[0][0] <= r * cell_km:
+                break
+        return [(f, -d) for d, _, f in sorted(best, key=lambda x: (-x[0], x[1]))]
+
+
+class Gazetteer:
+    # 자유 입력 "서울 강남역 근처" 에서 아는 지명 중 가장 긴 것을 찾아 좌표로
+    def __init__(self, places):
+        self.names = []
+        self.coords = []
+        for name, lat, lon, aliases in places:
+            for alias in (name, *aliases):
+                self.names.append(alias)
+                self.coords.append((name, lat, lon))
+        self.matcher = KeywordMatcher([[n] for n in self.names])
+
+    def locate(self, text: str):
+        counts, _ = self.matcher.scan(text)
+        if not counts:
+            return None
+        g = max(counts, key=lambda g: (len(self.names[g]), -g))
+        return self.coords[g]
+
+
+def load_gazetteer(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return Gazetteer(
+            (row["name"], float(row["lat"]), float(row["lon"]), [a.strip() for a in (row.get("aliases") or "").split(";") if a.strip()])
+            for row in csv.DictReader(f)
+        )
+
+
+def departments_of(base: str):
+    # "응급의학과 (응급실)", "피부과 / 응급의학과" → {"응급의학과"}, {"피부과", "응급의학과"}
+    return {d.split("(")[0].strip() for d in base.split("/") if d.strip()}
+
+
+def facility_filter(final_triage, base):
+    # decide() 결과에 맞는 시설만: 1 → 응급실, 2 → 응급실/야간진료, 그 외 → 해당 진료과
+    if final_triage == 1:
+        return lambda f: f.er
+    if final_triage == 2:
+        return lambda f: f.er or f.night
+    depts = departments_of(base)
+    return lambda f: not depts.isdisjoint(f.departments)
+
+
+class FacilityFinder:
+    def __init__(self, facilities_path=DATA_DIR / "facilities.csv", gazetteer_path=DATA_DIR / "gazetteer.csv"):
+        self.index = GridIndex(load_facilities(facilities_path))
+        self.gazetteer = load_gazetteer(gazetteer_path)
+
+    def find(self, loc: str, final_triage, base, n=5, max_km=MAX_KM):
+        # → (찾은 지명, [(시설, km)]) / 지명을 모르면 None (지도 검색 링크로 대신)
+        place = self.gazetteer.locate(loc)
+        if place is None:
+            return None
+        name, lat, lon = place
+        return name, self.index.nearest(lat, lon, n, facility_filter(final_triage, base), max_km)
+
+
+_finder = None
+
+
+def get_finder() -> FacilityFinder:
+    # CSV 는 처음 쓸 때 한 번만 읽는다
+    global _finder
+    if _finder is None:
+        _finder = FacilityFinder()
+    return _finder
@@ -0,0 +1,222 @@
+from collections import deque
+
+# -----------------------------
+# 오타 허용 매칭 (자모 n-gram 색인 + 편집거리 확인)
+# -----------------------------
+# "흉퉁", "골젏", "가슴 통증" 같은 입력도 키워드에 걸리게 한다.
+# 1) 한글을 자모로 풀어서 (흉통 → ㅎㅠㅇㅌㅗㅇ)
+# 2) 편집을 k 번까지 허용하는 키워드는 자모열을 k+1 조각(n-gram)으로 나눠 색인한다.
+#    오타가 k 개 이하라면 적어도 한 조각은 입력에 그대로 남아 있다 (비둘기집 원리).
+# 3) 입력에서 조각이 보인 자리 근처만 "부분 문자열 편집거리" 로 확인한다.
+# 4) 거리 안에 들어도 글자 단위로 한 번 더 본다 (aligned) — 초성은 고치지 않고,
+#    한 글자에 한 번, 한 어절에 (글자 수 // 2) 번까지만 고친다. "마음 아픔" ≠ "가슴 아픔", "딴 소리" ≠ "딱 소리"
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+def decompose(text: str) -> str:
+    out = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(CHOSEONG[code // 588])
+            out.append(JUNGSEONG[code % 588 // 28])
+            if code % 28:
+                out.append(JONGSEONG[code % 28])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def decompose_indexed(text: str):
+    # decompose() + 자모 위치마다 원래 글자 위치
+    jamo, owner = [], []
+    for i, ch in enumerate(text):
+        part = decompose(ch)
+        jamo.append(part)
+        owner.extend([i] * len(part))
+    return "".join(jamo), owner
+
+
+def bigrams(s: str):
+    return {s[i:i + 2] for i in range(len(s) - 1)}
+
+
+def pieces(jamo: str, k: int):
+    # 자모열을 k+1 개의 연속 조각으로 → [(조각, 시작 위치)]
+    n = k + 1
+    bounds = [len(jamo) * i // n for i in range(n + 1)]
+    return [(jamo[bounds[i]:bounds[i + 1]], bounds[i]) for i in range(n)]
+
+
+def max_edits(jamo_len: int) -> int:
+    # 짧은 키워드(코피, 멍, 불에 …)는 오타를 허용하면 엉뚱한 단어가 걸려서 정확 매칭만
+    if jamo_len < 6:
+        return 0
+    if jamo_len < 10:
+        return 1
+    return 2
+
+
+def shape(pattern: str):
+    # 키워드 자모마다 (종류, 글자 번호, 어절 번호) + 어절마다 편집 예산
+    # 종류: "c" 초성·한글이 아닌 글자 (고치지 않는다), "v" 중성·종성, " " 띄어쓰기
+    kinds, budgets = [], []
+    syl = word = count = 0
+    for ch in pattern:
+        if ch == " ":
+            kinds.append((" ", -1, -1))
+            budgets.append(count // 2)
+            word += 1
+            count = 0
+            continue
+        part = decompose(ch)
+        kinds.append(("c", syl, word))
+        kinds.extend(("v", syl, word) for _ in part[1:])
+        syl += 1
+        count += 1
+    budgets.append(count // 2)
+    return tuple(kinds), tuple(budgets)
+
+
+def aligned(pattern: str, kinds, budgets, window: str, limit: int):
+    # pattern(자모) 을 window 의 어떤 부분 문자열에 글자 단위 예산 안에서 맞출 수 있으면 그 끝 위치 (아니면 None)
+    # - 초성은 바꾸거나 빼지 않는다 ("마음" ≠ "가슴", "국" ≠ "물")
+    # - 한 글자에 편집 1번, 한 어절에 (글자 수 // 2) 번까지 — 한 글자 어절은 그대로 ("딴" ≠ "딱")
+    # - 띄어쓰기를 넣고 빼는 것은 전체 한도(limit)에만 센다 ("가슴 통증" = "가슴통증")
+    # 상태 (키워드 위치, 입력 위치, 전체 편집, 지금 글자 편집, 지금 어절 편집) 를 편집이 적은 것부터 훑어서 (0-1 BFS)
+    # 끝 위치는 편집이 가장 적은 맞춤의 것 — 뒤따르는 조사까지 키워드로 먹지 않는다
+    m, n = len(pattern), len(window)
+    queue = deque((0, j, 0, 0, 0) for j in range(n))
+    seen = set()
+    while queue:
+        state = queue.popleft()
+        if state in seen:
+            continue
+        seen.add(state)
+        i, j, total, syl, wrd = state
+        if i == m:
+            return j
+        kind, s, w = kinds[i]
+        # 새 글자/새 어절로 들어가면 그 글자/어절 편집 수는 0 부터
+        cs = syl if i and kinds[i - 1][1] == s else 0
+        cw = wrd if i and kinds[i - 1][2] == w else 0
+        ch = window[j] if j < n else None
+        if ch == pattern[i]:
+            queue.appendleft((i + 1, j + 1, total, cs, cw))
+        if total >= limit:
+            continue
+        if kind == " ":
+            queue.append((i + 1, j, total + 1, 0, 0))
+        elif kind == "v" and cs < 1 and cw < budgets[w]:
+            queue.append((i + 1, j, total + 1, 1, cw + 1))
+            if ch is not None and ch != " " and ch != pattern[i]:
+                queue.append((i + 1, j + 1, total + 1, 1, cw + 1))
+        if ch == " ":
+            queue.append((i, j + 1, total + 1, syl, wrd))
+        elif ch is not None and i and kinds[i - 1][0] != " " and syl < 1 and wrd < budgets[kinds[i - 1][2]]:
+            # 앞 글자에 자모가 하나 더 붙은 경우 ("골저" → "골절")
+            queue.append((i, j + 1, total + 1, syl + 1, wrd + 1))
+    return None
+
+
+def substring_distance(pattern: str, text: str, limit: int) -> int:
+    # pattern 과 text 의 "어떤 부분 문자열" 사이 최소 편집거리 (Sellers). limit 를 넘으면 limit+1.
+    m = len(pattern)
+    prev = list(range(m + 1))
+    best = prev[m]
+    for ch in text:
+        cur = [0]  # 부분 문자열은 어디서든 시작할 수 있어서 첫 칸은 0
+        left = 0
+        for i in range(m):
+            v = prev[i] if pattern[i] == ch else prev[i] + 1
+            if prev[i + 1] + 1 < v:
+                v = prev[i + 1] + 1
+            if left + 1 < v:
+                v = left + 1
+            cur.append(v)
+            left = v
+        prev = cur
+        if left < best:
+            best = left
+            if best == 0:
+                break
+    return best if best <= limit else limit + 1
+
+
+class FuzzyIndex:
+    def __init__(self, patterns, exact_only=frozenset()):
+        # exact_only: 오타 허용 없이 정확히만 찾을 패턴 id (응급 단어처럼 잘못 걸리면 위험한 것)
+        self.jamo = [decompose(p) for p in patterns]
+        self.limits = [0 if pid in exact_only else max_edits(len(j)) for pid, j in enumerate(self.jamo)]
+        self.grams = [bigrams(j) for j in self.jamo]
+        self.shapes = [shape(p) for p in patterns]
+        self.solid = [j.replace(" ", "") for j in self.jamo]
+        # 조각 → [(패턴 id, 키워드 안에서의 위치)]
+        self.postings = {}
+        for pid, (jamo, limit) in enumerate(zip(self.jamo, self.limits)):
+            if limit == 0:
+                continue
+            for piece, offset in pieces(jamo, limit):
+                self.postings.setdefault(piece, []).append((pid, offset))
+        self.lengths = sorted({len(p) for p in self.postings})
+
+    def search(self, text: str, skip=frozenset()):
+        # 오타 허용으로 걸린 {패턴 id: "exact" | "fuzzy"} (skip 은 이미 정확히 걸린 패턴)
+        # 띄어쓰기만 다른 자리("가슴 통증" ↔ "가슴통증")가 하나라도 있으면 "exact"
+        jamo = decompose(text)
+        postings = self.postings
+        found = {}
+        tried = set()
+        for i in range(len(jamo)):
+            for n in self.lengths:
+                hits = postings.get(jamo[i:i + n])
+                if not hits:
+                    continue
+                for pid, offset in hits:
+                    if found.get(pid) == "exact" or pid in skip:
+                        continue
+                    start = i - offset
+                    if (pid, start) in tried:
+                        continue
+                    tried.add((pid, start))
+                    hit = self._verify(pid, start, jamo)
+                    if hit is not None and found.get(pid) != "exact":
+                        found[pid] = hit[0]
+        return found
+
+    def anchors(self, jamo: str):
+        # 확인을 통과한 (패턴 id, 키워드 시작 자모 위치, "exact" | "fuzzy", 걸린 자리 끝 자모 위치 + 1) 전부
+        # — search() 와 같은 후보·같은 확인.
+        # 입력 일부만 다시 볼 때(incremental) 어느 자리에서 걸렸는지까지 필요해서 따로 둔다
+        postings = self.postings
+        tried = set()
+        out = []
+        for i in range(len(jamo)):
+            for n in self.lengths:
+                for pid, offset in postings.get(jamo[i:i + n], ()):
+                    key = (pid, i - offset)
+                    if key not in tried:
+                        tried.add(key)
+                        hit = self._verify(pid, key[1], jamo)
+                        if hit is not None:
+                            out.append(key + hit)
+        return out
+
+    def _verify(self, pid, start, jamo):
+        # 조각 위치로 맞춘 키워드 자리 ± 허용 편집 수 만큼만 본다
+        # → None (안 걸림) 또는 ("exact" (띄어쓰기만 다름) | "fuzzy", 걸린 자리 끝 자모 위치 + 1)
+        limit = self.limits[pid]
+        lo = max(0, start - limit)
+        window = jamo[lo:start + len(self.jamo[pid]) + limit]
+        # 편집 1번은 2-gram 을 최대 2개 깨뜨린다 → 공유 2-gram 이 모자라면 DP 생략
+        grams = self.grams[pid]
+        if len(grams & bigrams(window)) < len(grams) - 2 * limit:
+            return None
+        if substring_distance(self.jamo[pid], window, limit) > limit:
+            return None
+        stop = aligned(self.jamo[pid], *self.shapes[pid], window, limit)
+        if stop is None:
+            return None
+        return "exact" if self.solid[pid] in window.replace(" ", "") else "fuzzy", lo + stop
@@ -0,0 +1,271 @@
+from array import array
+
+from core import negation
+from core.fuzzy import decompose
+
+# -----------------------------
+# 입력 중 실시간 분석 (바뀐 부분만 다시 훑기)
+# -----------------------------
+# 글자마다 아래를 기억해 둔다. 세션마다 하나씩 들고 있으므로 글자당 몇 바이트로 줄여 둔다.
+#   states[i]  i 번째 글자까지 읽은 뒤의 (Aho-Corasick 상태, 공백 대기, 글자 있었음) — int32 배열
+#   widths[i]  그 글자가 정규화된 텍스트에 내보낸 글자 수 — 0 (""), 1 ("가"), 2 (" 가"). 바이트 배열
+#   exact[i]   그 글자에서 끝난 (키워드 id, 부정됨) 들
+#   fuzzy[i]   그 글자에서 시작하는, 오타 허용 확인을 통과한 (키워드 id, 칸) 들
+#              칸 = _counts 의 자리 — 띄어쓰기만 다르면 정확(0·1), 아니면 오타(2·3) + 부정됨
+#
+# normalize() 는 "양끝 공백 제거 + 연속 공백을 한 칸으로" 라서, 공백을 바로 내보내지 않고
+# 다음 글자가 올 때 " 가" 처럼 붙여 내보내면 내보낸 것을 이은 것이 normalize(text) 와 같다.
+#
+# 편집이 들어오면 편집 앞 글자의 상태에서 다시 읽기 시작해, 편집 뒤 원래 글자에서
+# 상태가 예전과 같아지는 순간 멈춘다. 상태 깊이는 가장 긴 키워드 길이를 넘지 않으므로
+# 편집 경계에 걸친 키워드까지 포함해 "편집 길이 + 키워드 길이" 만큼만 읽는다.
+# 오타 허용은 키워드 길이 + 허용 편집 수 범위 안의 글자에만 좌우되므로 그 주변만 다시 확인한다.
+# 부정 여부는 키워드 뒤 negation.LOOKAHEAD 글자에만 좌우되므로 편집 앞 그만큼의 키워드만 다시 본다.
+
+
+def _pack(ac, pending, seen):
+    return ac * 4 + pending * 2 + seen
+
+
+INITIAL = _pack(0, False, False)
+
+
+def _emit(text, widths, i):
+    # 글자 i 가 내보낸 문자열
+    w = widths[i]
+    return text[i] if w == 1 else " " + text[i] if w else ""
+
+
+class IncrementalAnalyzer:
+    def __init__(self, engine, text=""):
+        self.engine = engine
+        self.text = ""
+        self.states = array("i")
+        self.widths = bytearray()
+        self.exact = []
+        self.fuzzy = []
+        # {키워드 id: [정확·긍정, 정확·부정, 오타·긍정, 오타·부정]} — negation.classify() 입력
+        self._counts = {}
+        self._result = None
+        fz = engine.fuzzy
+        if fz is not None:
+            on = [pid for pid, limit in enumerate(fz.limits) if limit]
+            # 확인 창: 시작 자리 앞으로 back 자, 뒤로 ahead 자 (자모 수 ≤ 글자 수라 글자로 세도 넉넉함)
+            self._back = max((fz.limits[p] for p in on), default=0)
+            self._ahead = max((len(fz.jamo[p]) + fz.limits[p] for p in on), default=0) + negation.LOOKAHEAD
+        if text:
+            self.edit(0, 0, text)
+
+    # -------- 편집 --------
+    def update(self, new_text: str):
+        # 화면에서 받은 전체 텍스트 → 앞뒤 공통 부분을 빼고 바뀐 구간만 edit()
+        old = self.text
+        if new_text == old:
+            return
+        if new_text.startswith(old):
+            self.edit(len(old), len(old), new_text[len(old):])
+        elif old.startswith(new_text):
+            self.edit(len(new_text), len(old), "")
+        else:
+            limit = min(len(old), len(new_text))
+            p = _common_length(old, new_text, limit)
+            s = _common_length(old[::-1], new_text[::-1], limit - p)
+            self.edit(p, len(old) - s, new_text[p:len(new_text) - s])
+        # 내용이 같은 사본 대신 위젯이 들고 있는 문자열을 같이 쓴다
+        self.text = new_text
+
+    def edit(self, start: int, end: int, replacement: str):
+        # text[start:end] 를 replacement 로 바꾼다
+        old_text = self.text
+        if not 0 <= start <= end <= len(old_text):
+            raise IndexError(f"edit span out of range: {start}:{end}")
+        if start == end and not replacement:
+            return
+        text = old_text[:start] + replacement + old_text[end:]
+        states = self.states
+        step, emits_of = self.engine.matcher.step, self.engine.matcher.emits
+
+        # 1) 편집 지점부터 상태가 예전과 다시 같아질 때까지 읽는다
+        st = states[start - 1] if start else INITIAL
+        new_states, new_widths, new_exact = array("i"), bytearray(), []
+        changed_end = start + len(replacement)  # 새 텍스트에서 편집 구간 끝
+        shift = changed_end - end
+        j = start
+        while j < len(text):
+            ch = text[j]
+            ac, pending, seen = st >> 2, st >> 1 & 1, st & 1
+            if ch.isspace():
+                emit, found = "", ()
+                st = _pack(ac, seen, seen)
+            else:
+                emit = " " + ch if pending else ch
+                found = []
+                for c in emit:
+                    ac = step(ac, c)
+                    found.extend(emits_of(ac))
+                st = _pack(ac, False, True)
+            new_states.append(st)
+            new_widths.append(len(emit))
+            new_exact.append(found)
+            j += 1
+            if j > changed_end and states[j - 1 - shift] == st:
+                break
+        old_stop = j - shift
+
+        for found in self.exact[start:old_stop]:
+            self._add(found, -1)
+        for found in self.fuzzy[start:old_stop]:
+            self._add(found, -1)
+        self.text = text
+        self.states[start:old_stop] = new_states
+        self.widths[start:old_stop] = new_widths
+        # 다시 읽은 글자의 결과는 비워 두고 아래에서 부정 여부와 함께 새로 채운다
+        self.exact[start:old_stop] = [()] * len(new_states)
+        self.fuzzy[start:old_stop] = [()] * len(new_states)
+        self._refresh_negation(start)
+        patterns = self.engine.matcher.patterns
+        for i, found in enumerate(new_exact, start):
+            if found:
+                following = _following(text, self.widths, i)
+                found = tuple((pid, negation.negated(following, patterns[pid])) for pid in found)
+                self.exact[i] = found
+                self._add(found, 1)
+        if self.engine.fuzzy is not None:
+            self._refresh_fuzzy(start, j)
+        self._result = None
+
+    def _refresh_negation(self, lo):
+        # 글자 lo 부터 출력이 바뀌었다 → 뒤쪽 확인 범위가 lo 에 닿는 앞쪽 키워드만 부정 여부를 다시 본다
+        text, widths, exact = self.text, self.widths, self.exact
+        patterns = self.engine.matcher.patterns
+        first, _ = _walk_back(widths, lo, negation.LOOKAHEAD, 0)
+        for i in range(first, lo):
+            if exact[i]:
+                following = _following(text, widths, i)
+                found = tuple((pid, negation.negated(following, patterns[pid])) for pid, _ in exact[i])
+                self._add(exact[i], -1)
+                self._add(found, 1)
+                exact[i] = found
+
+    def _refresh_fuzzy(self, lo, hi):
+        # 글자 [lo, hi) 의 출력이 바뀌었다 → 창(부정 확인 범위 포함)이 그 구간에 닿는 시작 자리만 다시 확인
+        text, widths = self.text, self.widths
+        n = len(widths)
+        keep_lo, region_lo = _walk_back(widths, lo, self._ahead, self._back)
+        keep_hi, region_hi = _walk_ahead(widths, hi, n, self._back, self._ahead)
+
+        # 영역의 정규화된 텍스트, 자모 위치 → 영역 글자 위치, 영역 글자 위치 → 원래 글자 위치
+        chars, char_owner, jamo, owner = [], [], [], []
+        for i in range(region_lo, region_hi):
+            for c in _emit(text, widths, i):
+                part = decompose(c)
+                jamo.append(part)
+                owner.extend([len(chars)] * len(part))
+                chars.append(c)
+                char_owner.append(i)
+        region = "".join(chars)
+        jamo = "".join(jamo)
+
+        fresh = {}
+        patterns = self.engine.matcher.patterns
+        for pid, start, kind, stop in self.engine.fuzzy.anchors(jamo):
+            c = owner[start] if start >= 0 else 0
+            i = char_owner[c] if start >= 0 else region_lo
+            if keep_lo <= i < keep_hi:
+                end = owner[stop - 1]
+                neg = negation.negated(region[end + 1:end + 1 + negation.LOOKAHEAD], patterns[pid])
+                fresh.setdefault(i, []).append((pid, (0 if kind == "exact" else 2) + neg))
+
+        fuzzy = self.fuzzy
+        for i in range(keep_lo, keep_hi):
+            self._add(fuzzy[i], -1)
+            found = tuple(fresh.get(i, ()))
+            self._add(found, 1)
+            fuzzy[i] = found
+
+    def _add(self, found, delta):
+        # found = ((키워드 id, 칸), ...) — exact[i] 는 부정됨(0·1)이 곧 칸
+        counts = self._counts
+        for pid, slot in found:
+            row = counts.get(pid)
+            if row is None:
+                row = counts[pid] = [0, 0, 0, 0]
+            row[slot] += delta
+            if not any(row):
+                del counts[pid]
+
+    # -------- 결과 --------
+    def hits(self):
+        return negation.classify(self._counts)
+
+    def _scored(self):
+        if self._result is None:
+            self._result = self.engine.score(self.hits())
+        return self._result
+
+    def result(self):
+        # engine.analyze(self.text) 와 같은 (결과 목록, 응급 단어 여부)
+        results, emergency_hit, _, _ = self._scored()
+        return list(results), emergency_hit
+
+    def assess(self):
+        # engine.assess(self.text) 와 같은 (결과 목록, 응급 단어 여부, 가장 급한 우선순위)
+        results, emergency_hit, _, urgent = self._scored()
+        return list(results), emergency_hit, urgent
+
+    def matched_keywords(self):
+        return list(self._scored()[2])
+
+    def normalized(self) -> str:
+        text, widths = self.text, self.widths
+        return "".join(_emit(text, widths, i) for i in range(len(widths)))
+
+
+def _common_length(a, b, limit):
+    # a, b 의 공통 접두사 길이 (limit 이하) — 잘라 비교하는 이분 탐색이라 C 속도로 끝난다
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _following(text, widths, i):
+    # 글자 i 다음부터의 정규화된 텍스트 (negation.LOOKAHEAD 글자까지)
+    parts, count = [], 0
+    for j in range(i + 1, len(widths)):
+        if count >= negation.LOOKAHEAD:
+            break
+        parts.append(_emit(text, widths, j))
+        count += widths[j]
+    return "".join(parts)[:negation.LOOKAHEAD]
+
+
+def _walk_back(widths, i, first, second):
+    # i 앞으로 출력 글자 first 개를 넘길 때까지 → keep 시작, 다시 second 개 더 → 영역 시작
+    count = 0
+    while i > 0 and count < first:
+        i -= 1
+        count += widths[i]
+    keep = i
+    count = 0
+    while i > 0 and count < second:
+        i -= 1
+        count += widths[i]
+    return keep, i
+
+
+def _walk_ahead(widths, i, n, first, second):
+    count = 0
+    while i < n and count < first:
+        count += widths[i]
+        i += 1
+    keep = i
+    count = 0
+    while i < n and count < second:
+        count += widths[i]
+        i += 1
+    return keep, i
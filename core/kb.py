@@ -0,0 +1,233 @@
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+import time
+from pathlib import Path
+
+# -----------------------------
+# 증상 사전(knowledge base) 파일 로더
+# -----------------------------
+# data/*.json (또는 .yaml) → 스키마 검사 → 읽기 전용 Condition 튜플로 컴파일.
+# 컴파일 결과는 __pycache__ 에 pickle 로 남겨 두고, 원본 파일의 mtime/크기가
+# 같으면 다음 시작 때 파싱·검사 없이 바로 읽는다.
+
+CACHE_FORMAT = 1
+
+# 필드 이름 → (타입, 문자열 목록 여부)
+SCHEMA = {
+    "name": (str, False),
+    "keywords": (str, True),
+    "triage": (int, False),
+    "dept": (str, False),
+    "first_aid": (str, True),
+    "simple_tip": (str, False),
+    "red_flags": (str, True),
+}
+
+
+class KBError(ValueError):
+    pass
+
+
+class Condition:
+    # 질환 한 건. 기존 코드가 c["name"] 처럼 dict 로 읽으므로 매핑처럼도 동작한다.
+    __slots__ = tuple(SCHEMA)
+
+    def __init__(self, name, keywords, triage, dept, first_aid, simple_tip, red_flags):
+        for field, value in zip(self.__slots__, (name, keywords, triage, dept, first_aid, simple_tip, red_flags)):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, field, value):
+        raise AttributeError("Condition 은 읽기 전용입니다")
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return Condition, tuple(getattr(self, f) for f in self.__slots__)
+
+    def __getitem__(self, field):
+        if field not in SCHEMA:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __contains__(self, field):
+        return field in SCHEMA
+
+    def get(self, field, default=None):
+        return getattr(self, field) if field in SCHEMA else default
+
+    def keys(self):
+        return self.__slots__
+
+    def __eq__(self, other):
+        return isinstance(other, Condition) and all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __hash__(self):
+        return hash((self.name, self.keywords))
+
+    def __repr__(self):
+        return f"Condition({self.name!r}, triage={self.triage})"
+
+
+class KnowledgeBase:
+    __slots__ = ("conditions", "emergency_words", "signature")
+
+    def __init__(self, conditions, emergency_words, signature):
+        self.conditions = conditions
+        self.emergency_words = emergency_words
+        self.signature = signature
+
+
+def _read(path: Path):
+    with open(path, encoding="utf-8") as f:
+        if path.suffix.lower() in (".yaml", ".yml"):
+            import yaml  # YAML 사전을 쓸 때만 필요
+
+            try:
+                return yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise KBError(f"{path.name}: YAML 파싱 실패: {e}") from e
+        try:
+            return json.load(f)
+        except json.JSONDecodeError as e:
+            raise KBError(f"{path.name}: JSON 파싱 실패: {e}") from e
+
+
+def validate(raw, source="", levels=(1, 2, 3, 4)):
+    # 파일 하나 분량을 검사하고 그대로 돌려준다. 문제가 있으면 어디인지 알려주는 KBError.
+    if not isinstance(raw, dict):
+        raise KBError(f"{source}: 최상위는 객체여야 합니다")
+    words = raw.get("emergency_words", [])
+    if not isinstance(words, list) or not all(isinstance(w, str) and w for w in words):
+        raise KBError(f"{source}: emergency_words 는 비어 있지 않은 문자열 목록이어야 합니다")
+    conditions = raw.get("conditions")
+    if not isinstance(conditions, list):
+        raise KBError(f"{source}: conditions 목록이 없습니다")
+    for i, cond in enumerate(conditions):
+        where = f"{source}: conditions[{i}]"
+        if not isinstance(cond, dict):
+            raise KBError(f"{where}: 객체여야 합니다")
+        where = f"{where} ({cond.get('name', '?')})"
+        missing = [f for f in SCHEMA if f not in cond]
+        if missing:
+            raise KBError(f"{where}: 필수 항목 누락 {missing}")
+        unknown = [f for f in cond if f not in SCHEMA]
+        if unknown:
+            raise KBError(f"{where}: 알 수 없는 항목 {unknown}")
+        for field, (typ, is_list) in SCHEMA.items():
+            value = cond[field]
+            if is_list:
+                ok = isinstance(value, list) and value and all(isinstance(v, typ) and v for v in value)
+            else:
+                ok = isinstance(value, typ) and not isinstance(value, bool) and value != ""
+            if not ok:
+                kind = f"{typ.__name__} 목록" if is_list else typ.__name__
+                raise KBError(f"{where}: {field} 는 비어 있지 않은 {kind} 이어야 합니다")
+        if cond["triage"] not in levels:
+            raise KBError(f"{where}: triage 는 {list(levels)} 중 하나여야 합니다")
+    return raw
+
+
+def compile_kb(raws):
+    # 검사를 통과한 원본 여러 개 → (Condition 튜플, 응급 단어 튜플). 문자열은 intern 해서 공유.
+    intern = sys.intern
+    conditions, words = [], []
+    for raw in raws:
+        for c in raw["conditions"]:
+            conditions.append(Condition(
+                intern(c["name"]),
+                tuple(intern(k) for k in c["keywords"]),
+                c["triage"],
+                intern(c["dept"]),
+                tuple(c["first_aid"]),
+                c["simple_tip"],
+                tuple(c["red_flags"]),
+            ))
+        for w in raw.get("emergency_words", []):
+            w = intern(w)
+            if w not in words:
+                words.append(w)
+    return tuple(conditions), tuple(words)
+
+
+def _signature(paths):
+    sig = [CACHE_FORMAT]
+    for p in paths:
+        st = os.stat(p)
+        sig.append((str(p), st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def _cache_path(paths):
+    key = hashlib.sha1("|".join(str(p) for p in paths).encode("utf-8")).hexdigest()[:12]
+    return Path(paths[0]).parent / "__pycache__" / f"kb-{key}.pickle"
+
+
+def load(*paths, levels=(1, 2, 3, 4), use_cache=True):
+    paths = [Path(p).resolve() for p in paths]
+    signature = _signature(paths)
+    cache = _cache_path(paths)
+    if use_cache:
+        try:
+            with open(cache, "rb") as f:
+                cached = pickle.load(f)
+            if cached[0] == signature:
+                return KnowledgeBase(cached[1], cached[2], signature)
+        except (OSError, pickle.UnpicklingError, EOFError, IndexError, TypeError, AttributeError):
+            pass
+
+    raws = [validate(_read(p), p.name, levels) for p in paths]
+    conditions, words = compile_kb(raws)
+    if use_cache:
+        try:
+            cache.parent.mkdir(exist_ok=True)
+            tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump((signature, conditions, words), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache)
+        except OSError:
+            pass  # 캐시를 못 써도 동작에는 지장 없음
+    return KnowledgeBase(conditions, words, signature)
+
+
+class LiveKB:
+    # 파일이 바뀌면(mtime) 다시 읽는 사전. 이미 화면을 그리던 세션은 이전 엔진을
+    # 그대로 쓰고, 다음 실행부터 새 엔진을 받는다.
+    def __init__(self, *paths, build, levels=(1, 2, 3, 4), check_interval=1.0, on_reload=None):
+        self.paths = paths
+        self.levels = levels
+        self.check_interval = check_interval
+        self._build = build
+        self._on_reload = on_reload
+        self._lock = threading.Lock()
+        self.kb = load(*paths, levels=levels)
+        self._engine = build(self.kb)
+        self._checked = time.monotonic()
+        self.last_error = None
+
+    def engine(self):
+        now = time.monotonic()
+        if now - self._checked >= self.check_interval:
+            with self._lock:
+                if now - self._checked >= self.check_interval:
+                    self._checked = now
+                    self._maybe_reload()
+        return self._engine
+
+    def _maybe_reload(self):
+        try:
+            if _signature([Path(p).resolve() for p in self.paths]) == self.kb.signature:
+                return
+            kb = load(*self.paths, levels=self.levels)
+            engine = self._build(kb)
+        except (OSError, ValueError) as e:
+            # 고치는 중인 파일이 깨져 있어도 기존 사전으로 계속 서비스
+            self.last_error = e
+            return
+        old = self._engine
+        self.kb, self._engine, self.last_error = kb, engine, None
+        if self._on_reload is not None:
+            self._on_reload(old, engine)
@@ -0,0 +1,117 @@
+from collections import deque
+
+# -----------------------------
+# Aho-Corasick 키워드 매처
+# -----------------------------
+# 모든 키워드를 한 번에 오토마톤으로 컴파일해 두고,
+# 입력 텍스트를 한 번만 훑어서 "어떤 키워드가 등장했는지"를 알아낸다.
+# (키워드 수 × 텍스트 길이 → 텍스트 길이 + 매칭 수)
+
+
+class KeywordMatcher:
+    def __init__(self, groups, emergency_words=()):
+        # groups: 그룹(질환)별 키워드 리스트. 같은 키워드가 여러 그룹/여러 번 나와도 된다.
+        self.n_groups = len(groups)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        # 패턴 id → [(그룹 번호, 등장 횟수)] ; 그룹 번호 -1 은 응급 단어
+        # (키워드 → 질환 역색인 역할도 한다)
+        self.patterns = []
+        self.owners = []
+        pattern_ids = {}
+
+        def add(word, group):
+            pid = pattern_ids.get(word)
+            if pid is None:
+                pid = pattern_ids[word] = len(self.owners)
+                self.patterns.append(word)
+                self.owners.append({})
+                self._insert(word, pid)
+            owners = self.owners[pid]
+            owners[group] = owners.get(group, 0) + 1
+
+        for gi, words in enumerate(groups):
+            for w in words:
+                add(w, gi)
+        for w in emergency_words:
+            add(w, -1)
+
+        self.owners = [tuple(o.items()) for o in self.owners]
+        self._build_fail()
+
+    def _insert(self, word, pid):
+        goto = self._goto
+        s = 0
+        for ch in word:
+            nxt = goto[s].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto[s][ch] = nxt
+                goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            s = nxt
+        self._out[s].append(pid)
+
+    def _build_fail(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            s = queue.popleft()
+            for ch, t in goto[s].items():
+                queue.append(t)
+                f = fail[s]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[t] = goto[f].get(ch, 0)
+                out[t] = out[t] + out[fail[t]]
+
+    def step(self, s: int, ch: str) -> int:
+        # 상태 s 에서 글자 하나를 읽은 다음 상태 (입력 일부만 다시 훑을 때 씀)
+        goto, fail = self._goto, self._fail
+        while s and ch not in goto[s]:
+            s = fail[s]
+        return goto[s].get(ch, 0)
+
+    def emits(self, s: int):
+        # 상태 s 에 도착했을 때 끝나는 패턴 id 들
+        return self._out[s]
+
+    def find(self, text: str):
+        # 텍스트에 등장한 패턴 id 집합 (한 번의 선형 스캔)
+        goto, fail, out = self._goto, self._fail, self._out
+        seen = set()
+        s = 0
+        for ch in text:
+            while s and ch not in goto[s]:
+                s = fail[s]
+            s = goto[s].get(ch, 0)
+            if out[s]:
+                seen.update(out[s])
+        return seen
+
+    def find_all(self, text: str):
+        # [(패턴 id, 끝 글자 위치)] — 같은 키워드가 여러 번 나오면 전부 (부정 표현 확인용)
+        goto, fail, out = self._goto, self._fail, self._out
+        found = []
+        s = 0
+        for i, ch in enumerate(text):
+            while s and ch not in goto[s]:
+                s = fail[s]
+            s = goto[s].get(ch, 0)
+            for pid in out[s]:
+                found.append((pid, i))
+        return found
+
+    def scan(self, text: str):
+        # 매칭된 그룹만 {그룹: 매칭 키워드 수(중복 키워드 포함)} 와 응급 단어 포함 여부
+        counts = {}
+        emergency = False
+        for pid in self.find(text):
+            for group, weight in self.owners[pid]:
+                if group < 0:
+                    emergency = True
+                else:
+                    counts[group] = counts.get(group, 0) + weight
+        return counts, emergency
@@ -0,0 +1,162 @@
+from types import MappingProxyType
+
+from core import metrics
+
+# -----------------------------
+# MBTI 궁합 데이터
+# -----------------------------
+# 프로세스에 하나만 있고 모든 세션이 같이 읽으므로 전부 읽기 전용 (tuple / frozenset / mappingproxy)
+ALL_TYPES = (
+    "INTJ", "INTP", "ENTJ", "ENTP",
+    "INFJ", "INFP", "ENFJ", "ENFP",
+    "ISTJ", "ISFJ", "ESTJ", "ESFJ",
+    "ISTP", "ISFP", "ESTP", "ESFP",
+)
+
+GOLDEN_PAIRS = frozenset({
+    ("ENFP", "INTJ"), ("INTJ", "ENFP"),
+    ("ENTP", "INFJ"), ("INFJ", "ENTP"),
+    ("INFP", "ENFJ"), ("ENFJ", "INFP"),
+    ("INTP", "ENTJ"), ("ENTJ", "INTP"),
+    ("ISFP", "ESTJ"), ("ESTJ", "ISFP"),
+    ("ISTP", "ESFJ"), ("ESFJ", "ISTP"),
+    ("ISFJ", "ESTP"), ("ESTP", "ISFJ"),
+    ("ESFP", "ISTJ"), ("ISTJ", "ESFP"),
+})
+
+LETTER_INDEX = MappingProxyType({"I":0, "E":0, "N":1, "S":1, "T":2, "F":2, "J":3, "P":3})
+
+# 축마다 두 번째 글자(E/S/F/P)를 1 비트로 본다
+_SECOND_LETTERS = frozenset("ESFP")
+
+
+def encode(t: str) -> int:
+    # "ENFP" → 4비트 코드 (비트 위치 = LETTER_INDEX 의 축 번호)
+    code = 0
+    for ch in t:
+        if ch in _SECOND_LETTERS:
+            code |= 1 << LETTER_INDEX[ch]
+    return code
+
+
+# -----------------------------
+# 16×16 궁합 행렬 엔진
+# -----------------------------
+# 이론 하나(규칙 목록)를 점수/적합도/이유 표로 컴파일해 둔다. 규칙 정의는 core/theories.py 참고.
+# rules = [(종류, 인자, 점수, 이유 문장)]
+
+
+def reason_text(reason: str, points: float) -> str:
+    return f"{reason} ({round(points, 3):+g})"
+
+
+class CompatEngine:
+    def __init__(self, rules, types=ALL_TYPES, id="", name="", description=""):
+        import numpy as np  # 무거운 import 는 엔진을 처음 만들 때만
+
+        self.id = id
+        self.name = name
+        self.description = description
+        self.types = tuple(types)
+        self.index = {t: i for i, t in enumerate(self.types)}
+        self.codes = np.array([encode(t) for t in self.types], dtype=np.uint8)
+        self.reason_texts = tuple(reason_text(reason, points) for _, _, points, reason in rules)
+
+        # 축별로 글자가 다른지 여부: xor 의 각 비트
+        diff = self.codes[:, None] ^ self.codes[None, :]
+        n = len(self.types)
+        score = np.zeros((n, n))
+        mask = np.zeros((n, n), dtype=np.uint64)
+        for bit, (kind, arg, points, _) in enumerate(rules):
+            if kind == "same":
+                hit = ((diff >> arg) & 1) == 0
+            elif kind == "differ":
+                hit = ((diff >> arg) & 1) == 1
+            elif kind == "both":
+                has = np.array([all(ch in t for ch in arg) for t in self.types])
+                hit = has[:, None] & has[None, :]
+            elif kind == "pairs":
+                hit = np.zeros((n, n), dtype=bool)
+                for a, b in arg:
+                    if a in self.index and b in self.index:
+                        hit[self.index[a], self.index[b]] = True
+            elif kind == "same_type":
+                hit = np.eye(n, dtype=bool)
+            else:
+                raise ValueError(f"unknown rule kind: {kind!r}")
+            score += points * hit
+            mask |= hit.astype(np.uint64) << np.uint64(bit)
+
+        # 적합도 100% = 이 이론으로 실제로 나올 수 있는 최고점
+        top = float(score.max())
+        self.max_possible = top if top > 0 else 1.0
+        self.score = score
+        self.reason_mask = mask
+        # 파이썬 round 와 소수점 처리가 완전히 같도록 256칸만 따로 계산
+        self.norm = np.array(
+            [[round(float(s) / self.max_possible * 100, 1) for s in row] for row in score.tolist()]
+        )
+        for arr in (self.score, self.norm, self.reason_mask):
+            arr.setflags(write=False)
+
+        # 유형별 순위표를 미리 만들어 둔다: 점수 → 적합도 내림차순, 동점이면 ALL_TYPES 순서
+        # 각 줄 = (상대 유형, 점수, 적합도, 이유 문장)
+        self.views = {}
+        for i, a in enumerate(self.types):
+            rows = [
+                (b, float(self.score[i, j]), float(self.norm[i, j]), " · ".join(self.reasons_of(int(self.reason_mask[i, j]))) or "—")
+                for j, b in enumerate(self.types)
+            ]
+            rows.sort(key=lambda r: (-r[1], -r[2]))
+            self.views[a] = tuple(rows)
+
+    def reasons_of(self, mask: int):
+        return [text for bit, text in enumerate(self.reason_texts) if mask >> bit & 1]
+
+    def lookup(self, a: str, b: str):
+        i, j = self.index[a], self.index[b]
+        return float(self.score[i, j]), float(self.norm[i, j]), self.reasons_of(int(self.reason_mask[i, j]))
+
+    def ranked(self, a: str, k=None):
+        # a 에게 맞는 상대 순위 (앞에서 k 개만 잘라 주는 건 O(k))
+        view = self.views[a]
+        return view if k is None else view[:k]
+
+    def batch(self, a_types, b_types):
+        # 같은 길이의 유형 목록 두 개 → (점수, 적합도, 이유 비트마스크) 배열
+        import numpy as np
+
+        ai = np.fromiter((self.index[t] for t in a_types), dtype=np.intp)
+        bi = np.fromiter((self.index[t] for t in b_types), dtype=np.intp)
+        return self.score[ai, bi], self.norm[ai, bi], self.reason_mask[ai, bi]
+
+
+_theories = None
+
+
+def get_theories():
+    # (기본 이론 id, {id: CompatEngine}) — 처음 쓸 때 data/theories.json 을 한 번만 컴파일
+    global _theories
+    if _theories is None:
+        from core.theories import load_theories
+
+        _theories = load_theories()
+    return _theories
+
+
+def get_engine(theory=None) -> CompatEngine:
+    # 이론 바꾸기 = 미리 만든 표 하나를 고르는 것 (dict 조회)
+    default, engines = get_theories()
+    return engines[theory or default]
+
+
+def __getattr__(name):
+    # `from core.mbti import ENGINE` 도 지연 생성으로 동작하게
+    if name == "ENGINE":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@metrics.timed("calc_score", sample=16)
+def calc_score(a: str, b: str):
+    return get_engine().lookup(a, b)
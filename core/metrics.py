@@ -0,0 +1,274 @@
+import contextlib
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from itertools import count
+
+# -----------------------------
+# 가벼운 계측 (지연 시간 히스토그램 + 카운터)
+# -----------------------------
+# 환경 변수로 켠다. 꺼져 있으면 timed() 는 원래 함수를 그대로 돌려주고
+# stage() 는 아무것도 하지 않는 컨텍스트라서 비용이 거의 없다.
+#
+#   APP_METRICS=1                 수집만 (render() 로 꺼내 봄)
+#   APP_METRICS_PORT=9108         http://host:9108/metrics 로 Prometheus 텍스트 제공
+#   APP_METRICS_FILE=path.prom    APP_METRICS_INTERVAL 초(기본 15)마다 파일로 덤프
+#                                 (node_exporter textfile collector 형식)
+
+ENABLED = bool(os.environ.get("APP_METRICS") or os.environ.get("APP_METRICS_PORT") or os.environ.get("APP_METRICS_FILE"))
+
+PREFIX = "app"
+# 10µs ~ 10s, 대략 한 자릿수마다 세 칸
+BUCKETS = (
+    1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "n", "lock")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.n = 0
+        self.lock = threading.Lock()
+
+    def observe(self, seconds):
+        i = bisect_left(BUCKETS, seconds)
+        with self.lock:
+            self.counts[i] += 1
+            self.total += seconds
+            self.n += 1
+
+
+class Counter:
+    __slots__ = ("labels", "values", "lock")
+
+    def __init__(self, labels):
+        self.labels = labels
+        self.values = {}  # 라벨 값 튜플 → 횟수
+        self.lock = threading.Lock()
+
+    def inc(self, key=(), by=1):
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + by
+
+    def inc_many(self, keys):
+        # 호출 한 번에 잠금도 한 번만
+        with self.lock:
+            values = self.values
+            for key in keys:
+                values[key] = values.get(key, 0) + 1
+
+    def get(self, key=()):
+        return self.values.get(key, 0)
+
+
+class Registry:
+    def __init__(self):
+        self.histograms = {}  # stage → Histogram
+        self.counters = {}  # 이름 → Counter
+        self._lock = threading.Lock()
+
+    def histogram(self, stage):
+        with self._lock:
+            return self.histograms.setdefault(stage, Histogram())
+
+    def counter(self, name, labels=()):
+        with self._lock:
+            return self.counters.setdefault(name, Counter(labels))
+
+    def clear(self):
+        with self._lock:
+            for h in self.histograms.values():
+                h.__init__()
+            for c in self.counters.values():
+                c.values.clear()
+
+    def render(self):
+        # Prometheus text exposition format 0.0.4
+        lines = [
+            f"# HELP {PREFIX}_stage_seconds Latency of instrumented stages (normalize/calc_score are sampled).",
+            f"# TYPE {PREFIX}_stage_seconds histogram",
+        ]
+        with self._lock:
+            histograms = sorted(self.histograms.items())
+            counters = sorted(self.counters.items())
+        for stage, h in histograms:
+            with h.lock:
+                counts, total, n = list(h.counts), h.total, h.n
+            label = f'stage="{_escape(stage)}"'
+            running = 0
+            for le, c in zip(BUCKETS, counts):
+                running += c
+                lines.append(f'{PREFIX}_stage_seconds_bucket{{{label},le="{le:g}"}} {running}')
+            lines.append(f'{PREFIX}_stage_seconds_bucket{{{label},le="+Inf"}} {n}')
+            lines.append(f"{PREFIX}_stage_seconds_sum{{{label}}} {total:.9f}")
+            lines.append(f"{PREFIX}_stage_seconds_count{{{label}}} {n}")
+
+        for name, c in counters:
+            with c.lock:
+                values = sorted(c.values.items(), key=lambda kv: tuple(map(str, kv[0])))
+            lines.append(f"# TYPE {PREFIX}_{name} counter")
+            for key, v in values:
+                body = ",".join(f'{k}="{_escape(str(val))}"' for k, val in zip(c.labels, key))
+                lines.append(f"{PREFIX}_{name}{{{body}}} {v}" if body else f"{PREFIX}_{name} {v}")
+
+        decisions = DECISIONS.get()
+        if decisions:
+            lines.append(f"# TYPE {PREFIX}_emergency_override_ratio gauge")
+            lines.append(f"{PREFIX}_emergency_override_ratio {OVERRIDES.get() / decisions:.6f}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(s):
+    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REGISTRY = Registry()
+KEYWORD_HITS = REGISTRY.counter("keyword_hits_total", ("keyword", "kind"))
+CONDITION_HITS = REGISTRY.counter("condition_hits_total", ("condition",))
+TRIAGE_LEVELS = REGISTRY.counter("triage_level_total", ("level",))
+DECISIONS = REGISTRY.counter("decisions_total")
+OVERRIDES = REGISTRY.counter("emergency_override_total")
+
+
+def render():
+    return REGISTRY.render()
+
+
+def timed(stage, sample=1):
+    # 함수 데코레이터. 아주 싼 함수는 sample 번에 한 번만 시간을 잰다
+    def wrap(fn):
+        if not ENABLED:
+            return fn
+        hist = REGISTRY.histogram(stage)
+        clock = time.perf_counter
+
+        if sample <= 1:
+            @wraps(fn)
+            def inner(*args, **kwargs):
+                start = clock()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    hist.observe(clock() - start)
+        else:
+            ticks = count()
+
+            @wraps(fn)
+            def inner(*args, **kwargs):
+                if next(ticks) % sample:
+                    return fn(*args, **kwargs)
+                start = clock()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    hist.observe(clock() - start)
+        return inner
+    return wrap
+
+
+_NULL = contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def _stage(hist):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        hist.observe(time.perf_counter() - start)
+
+
+def stage(name):
+    # with metrics.stage("dataframe"): ... — 코드 블록 단위 계측
+    if not ENABLED:
+        return _NULL
+    return _stage(REGISTRY.histogram(name))
+
+
+def record_keywords(keywords):
+    # analyze() 한 번에 걸린 키워드 [(키워드, "exact" | "fuzzy" | "negated")]
+    KEYWORD_HITS.inc_many(keywords)
+
+
+def record_decision(picks, final_triage, overridden):
+    # decide() 한 번의 결과: 대표 질환, 최종 우선순위, 응급 단어로 1단계로 올렸는지
+    DECISIONS.inc()
+    TRIAGE_LEVELS.inc((final_triage,))
+    CONDITION_HITS.inc_many((c["name"],) for c in picks)
+    if overridden:
+        OVERRIDES.inc()
+
+
+# -----------------------------
+# 내보내기: HTTP 엔드포인트 / 주기적 파일 덤프
+# -----------------------------
+_started = set()
+
+
+def serve(port, host="0.0.0.0"):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+def dump(path):
+    # 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 바꿔치기
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(tmp, path)
+
+
+def dump_every(path, interval=15.0):
+    def loop():
+        while True:
+            time.sleep(interval)
+            try:
+                dump(path)
+            except OSError as e:
+                print(f"metrics dump 실패: {e}", file=sys.stderr)
+
+    threading.Thread(target=loop, name="metrics-dump", daemon=True).start()
+
+
+def _start_exporters():
+    port = os.environ.get("APP_METRICS_PORT")
+    if port and "http" not in _started:
+        _started.add("http")
+        try:
+            serve(int(port))
+        except OSError as e:
+            # 같은 포트를 다른 앱(main.py / test.py)이 먼저 잡았을 수 있다
+            print(f"metrics 엔드포인트를 열지 못했어요 (:{port}): {e}", file=sys.stderr)
+    path = os.environ.get("APP_METRICS_FILE")
+    if path and "file" not in _started:
+        _started.add("file")
+        dump_every(path, float(os.environ.get("APP_METRICS_INTERVAL", "15")))
+
+
+if ENABLED:
+    _start_exporters()
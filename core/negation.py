@@ -0,0 +1,72 @@
+# -----------------------------
+# 부정 표현 감지 ("흉통은 없고 코피가 나요")
+# -----------------------------
+# 부정어가 키워드를 바로 받을 때만 "부정됨" 으로 본다.
+#   키워드 + (조사 은/는/이/가/도/을/를/이랑) + (부사 전혀/별로) + 없/아니(아닌·아냐·아녜…)/안
+# 사이에 다른 말이 끼면("의식 후 … 없어요", "흉통 때문에 잠이 안 와요", "마비 감각이 없어요")
+# 부정어는 그 말을 받는 것이라 키워드는 그대로 둔다. 응급 단어도 이 모양일 때만 부정된다.
+# - 멈추/그치/낫/사라지… 와 함께 쓰인 부정("코피가 안 멈춰요")은 증상이 계속된다는 뜻이라 제외
+# - "없지 않" 같은 이중 부정, "없어지지 않" 도 마찬가지
+# - "피가 멈추지" 처럼 "…지" 로 끝나는 키워드는 뒤의 "않" 까지가 키워드의 뜻이라 제외
+# 애매하면 부정으로 보지 않는다 — 응급 증상을 빠뜨리는 쪽이 더 위험하다.
+# 한 자리에서 최대 LOOKAHEAD 글자만 보므로 전체 비용은 (텍스트 + 매칭 수 × LOOKAHEAD).
+
+PARTICLES = ("이랑", "은", "는", "이", "가", "도", "을", "를")
+ADVERBS = ("전혀", "별로")
+PERSIST = ("멈", "멎", "그치", "그쳐", "낫", "나아", "가라앉", "줄어", "사라지", "사라져", "없어지", "없어져")
+# 아니 / 아닌 / 아님 / 아닙니다 / 아냐 / 아녜요 / 아녀요
+NOT_FORMS = frozenset("니닌님닙냐녜녀")
+# negated() 가 읽는 최대 글자 수 (조사 + 부사 둘 + "안 " + 세 글자짜리 어간, "지는 않" 확인까지)
+LOOKAHEAD = 24
+
+
+def has_cue(text: str) -> bool:
+    # 부정 표현이 아예 없으면 위치를 따질 필요도 없다
+    return "없" in text or "안" in text or any("아" + f in text for f in NOT_FORMS)
+
+
+def _before_not(following, k):
+    # following[k] 뒤가 "지 않" / "지는 않" / "지도 않" 이면 True ("없지 않아요" — 이중 부정)
+    rest = following[k + 1:k + 6].replace(" ", "")
+    return rest.startswith(("지않", "지는않", "지도않"))
+
+
+def _skip_spaces(following, k):
+    while following[k:k + 1] == " ":
+        k += 1
+    return k
+
+
+def negated(following: str, pattern: str) -> bool:
+    # following = 키워드 바로 다음부터의 (정규화된) 텍스트
+    if pattern.endswith("지"):
+        return False
+    k = next((len(p) for p in PARTICLES if following.startswith(p)), 0)
+    k = _skip_spaces(following, k)
+    for _ in range(2):
+        adverb = next((a for a in ADVERBS if following.startswith(a, k)), None)
+        if adverb is None:
+            break
+        k = _skip_spaces(following, k + len(adverb))
+    ch, nxt = following[k:k + 1], following[k + 1:k + 2]
+    if ch == "없":
+        return not following.startswith(("없어지", "없어져"), k) and not _before_not(following, k)
+    if ch == "아" and nxt in NOT_FORMS:
+        return not _before_not(following, k + 1)
+    if ch == "안" and k > 0 and following[k - 1] == " " and nxt in ("", " "):
+        return not following.startswith(PERSIST, _skip_spaces(following, k + 1))
+    return False
+
+
+def classify(counts):
+    # {패턴 id: [정확·긍정, 정확·부정, 오타·긍정, 오타·부정]} → {패턴 id: 종류}
+    # 한 번이라도 부정 없이 나왔으면 그 종류로, 전부 부정이었으면 "negated"
+    hits = {}
+    for pid, (exact, exact_neg, fuzzy, fuzzy_neg) in counts.items():
+        if exact:
+            hits[pid] = "exact"
+        elif fuzzy:
+            hits[pid] = "fuzzy"
+        elif exact_neg or fuzzy_neg:
+            hits[pid] = "negated"
+    return hits
@@ -0,0 +1,308 @@
+import math
+from collections import Counter, deque
+from fractions import Fraction
+from functools import lru_cache
+
+from core.mbti import ALL_TYPES, get_engine
+
+# -----------------------------
+# 그룹 매칭 (이벤트용 1:1 짝 / k명 팀)
+# -----------------------------
+# 사람 단위 O(n³) 배정 대신 "유형별 인원수" 16개만 가지고 푼다.
+# 1) 유형×유형 이분 그래프에서 최소비용 유량으로 완화해(LP 상한)
+# 2) 정수 부분만 짝으로 확정하고 (짝 종류마다 한 쌍씩은 다시 풀어 둔다)
+# 3) 남은 소수 인원은 유형 단위 DP 로 정확히 짝짓고, 2-교환으로 마무리한다.
+
+MAX_DENOMINATOR = 10_000
+# 남은 인원 DP 의 상태 수 상한 (= 유형별 (남은 수 + 1) 의 곱). 이만큼만 풀어서 정확히 다시 짝짓는다
+STATE_LIMIT = 4096
+
+
+def _weights(engine):
+    # 점수 표 → (정수 가중치, 배율). 이론마다 점수 단위가 달라서(기본 0.5, 절충 0.125 …)
+    # 표 전체의 최소공배수 분모를 곱해 정확히 정수로 만든다
+    n = len(engine.types)
+    fracs = [[Fraction(float(engine.score[i, j])).limit_denominator(MAX_DENOMINATOR) for j in range(n)] for i in range(n)]
+    scale = math.lcm(*(f.denominator for row in fracs for f in row))
+    return [[int(f * scale) for f in row] for row in fracs], scale
+
+
+def _min_cost_flow(counts, w):
+    # 왼쪽 유형 i(공급 counts[i]) → 오른쪽 유형 j(수요 counts[j]), 비용 -w[i][j]
+    n = len(counts)
+    src, snk = 2 * n, 2 * n + 1
+    graph = [[] for _ in range(2 * n + 2)]
+
+    def add(u, v, cap, cost):
+        graph[u].append([v, cap, cost, len(graph[v])])
+        graph[v].append([u, 0, -cost, len(graph[u]) - 1])
+
+    for i in range(n):
+        if counts[i]:
+            add(src, i, counts[i], 0)
+            add(n + i, snk, counts[i], 0)
+            for j in range(n):
+                if counts[j]:
+                    add(i, n + j, counts[i], -w[i][j])
+
+    flow = [[0] * n for _ in range(n)]
+    while True:
+        # SPFA 로 최단(최소비용) 증가 경로
+        dist = [None] * len(graph)
+        prev = [None] * len(graph)
+        dist[src] = 0
+        queue, inq = deque([src]), [False] * len(graph)
+        while queue:
+            u = queue.popleft()
+            inq[u] = False
+            for idx, (v, cap, cost, _) in enumerate(graph[u]):
+                if cap > 0 and (dist[v] is None or dist[u] + cost < dist[v]):
+                    dist[v] = dist[u] + cost
+                    prev[v] = (u, idx)
+                    if not inq[v]:
+                        inq[v] = True
+                        queue.append(v)
+        if dist[snk] is None:
+            break
+        push, v = None, snk
+        while v != src:
+            u, idx = prev[v]
+            cap = graph[u][idx][1]
+            push = cap if push is None else min(push, cap)
+            v = u
+        v = snk
+        while v != src:
+            u, idx = prev[v]
+            edge = graph[u][idx]
+            edge[1] -= push
+            graph[v][edge[3]][1] += push
+            if u < n and n <= v < 2 * n:
+                flow[u][v - n] += push
+            elif v < n and n <= u < 2 * n:
+                flow[v][u - n] -= push
+            v = u
+    return flow
+
+
+def _pair_leftover(left, w):
+    # 남은 인원(유형별 소수 명)을 정확히 짝짓는 DP. 홀수면 한 명은 남는다.
+    n = len(left)
+
+    @lru_cache(maxsize=None)
+    def best(state):
+        state = list(state)
+        i = next((k for k in range(n) if state[k]), None)
+        if i is None:
+            return 0, ()
+        state[i] -= 1
+        options = []
+        if sum(state) % 2 == 0:  # i 를 혼자 남기는 경우 (전체가 홀수일 때만)
+            sub, pairs = best(tuple(state))
+            options.append((sub, pairs))
+        for j in range(i, n):
+            if state[j]:
+                state[j] -= 1
+                sub, pairs = best(tuple(state))
+                options.append((sub + w[i][j], ((i, j),) + pairs))
+                state[j] += 1
+        return max(options, key=lambda o: o[0])
+
+    return best(tuple(left))
+
+
+def _states(left):
+    return math.prod(k + 1 for k in left)
+
+
+def _pair_greedy(left, w):
+    # 상태가 너무 많을 때: 남은 사람 중 점수가 가장 큰 유형 쌍부터 짝짓는다 (2-교환이 마무리)
+    left = list(left)
+    n = len(left)
+    total, pairs = 0, []
+    while sum(left) >= 2:
+        i, j = max(
+            ((i, j) for i in range(n) if left[i] for j in range(i, n) if left[j] > (i == j)),
+            key=lambda p: (w[p[0]][p[1]], -p[0], -p[1]),
+        )
+        left[i] -= 1
+        left[j] -= 1
+        total += w[i][j]
+        pairs.append((i, j))
+    return total, tuple(pairs)
+
+
+def _improve(pairs, left, w):
+    # 반올림으로 생긴 손해를 2-교환 지역 탐색으로 메운다
+    #   (a,b)+(c,d) → (a,c)+(b,d) / (a,d)+(b,c),  (a,b)+혼자 u → (u,a)+혼자 b ...
+    def key(i, j):
+        return (i, j) if i <= j else (j, i)
+
+    improved = True
+    while improved:
+        improved = False
+        kinds = [p for p, k in pairs.items() if k]
+        singles = [i for i, k in enumerate(left) if k]
+        for x, (a, b) in enumerate(kinds):
+            for c, d in kinds[x:]:
+                if (a, b) == (c, d) and pairs[(a, b)] < 2:
+                    continue
+                base = w[a][b] + w[c][d]
+                for p, q in ((key(a, c), key(b, d)), (key(a, d), key(b, c))):
+                    if w[p[0]][p[1]] + w[q[0]][q[1]] > base:
+                        pairs[(a, b)] -= 1
+                        pairs[(c, d)] -= 1
+                        pairs[p] += 1
+                        pairs[q] += 1
+                        improved = True
+                        break
+                if improved:
+                    break
+            if improved:
+                break
+            for u in singles:
+                for keep, drop in ((a, b), (b, a)):
+                    if w[u][keep] > w[a][b]:
+                        pairs[(a, b)] -= 1
+                        pairs[key(u, keep)] += 1
+                        left[u] -= 1
+                        left[drop] += 1
+                        improved = True
+                        break
+                if improved:
+                    break
+            if improved:
+                break
+    for p in [p for p, k in pairs.items() if not k]:
+        del pairs[p]
+
+
+def pair_type_counts(counts, engine=None):
+    # 유형별 인원수 → ({(i, j): 짝 수}, 점수 합계, LP 상한)
+    engine = engine or get_engine()
+    w, scale = _weights(engine)
+    flow = _min_cost_flow(counts, w)
+    n = len(counts)
+    upper = sum(flow[i][j] * w[i][j] for i in range(n) for j in range(n))  # 대칭 완화: 짝 점수 ×2
+
+    pairs = Counter()
+    left = list(counts)
+    for i in range(n):
+        k = flow[i][i] // 2
+        if k:
+            pairs[(i, i)] += k
+            left[i] -= 2 * k
+        for j in range(i + 1, n):
+            k = (flow[i][j] + flow[j][i]) // 2
+            if k:
+                pairs[(i, j)] += k
+                left[i] -= k
+                left[j] -= k
+
+    # 확정한 짝 종류마다 한 쌍씩 풀어서 남은 인원과 함께 다시 정확히 짝짓는다.
+    # DP 는 상태 수에 대해 지수라서 STATE_LIMIT 안에 드는 만큼만, 점수가 낮은 짝부터 푼다
+    # (사람이 적으면 전부 풀려서 정확한 최적, 많으면 나머지는 2-교환이 다듬는다)
+    for (i, j) in sorted(pairs, key=lambda p: (w[p[0]][p[1]], p)):
+        left[i] += 1
+        left[j] += 1
+        if _states(left) > STATE_LIMIT:
+            left[i] -= 1
+            left[j] -= 1
+            continue
+        pairs[(i, j)] -= 1
+    if _states(left) <= STATE_LIMIT:
+        _, extra = _pair_leftover(left, w)
+    else:
+        _, extra = _pair_greedy(left, w)
+    for p in extra:
+        pairs[p] += 1
+        left[p[0]] -= 1
+        left[p[1]] -= 1
+    _improve(pairs, left, w)
+    total = sum(k * float(engine.score[i, j]) for (i, j), k in pairs.items())
+    return pairs, total, upper / scale / 2
+
+
+def parse_participants(text):
+    # "이름 MBTI" 또는 "이름,MBTI" 한 줄에 한 명
+    people, bad = [], []
+    for line in text.splitlines():
+        parts = line.replace(",", " ").split()
+        if not parts:
+            continue
+        t = parts[-1].upper()
+        if t in ALL_TYPES:
+            people.append((" ".join(parts[:-1]) or f"참가자{len(people) + 1}", t))
+        else:
+            bad.append(line)
+    return people, bad
+
+
+def _queues(participants, engine):
+    # 유형별로 입력 순서를 지키는 대기열
+    queues = [deque() for _ in engine.types]
+    for name, t in participants:
+        queues[engine.index[t]].append(name)
+    return queues
+
+
+def pair_participants(participants, engine=None):
+    # participants: [(이름, MBTI)] → 총점을 최대로 하는 1:1 짝
+    engine = engine or get_engine()
+    queues = _queues(participants, engine)
+    counts = [len(q) for q in queues]
+    type_pairs, total, upper = pair_type_counts(counts, engine)
+
+    pairs = []
+    for (i, j), k in sorted(type_pairs.items(), key=lambda x: (-engine.score[x[0]], x[0])):
+        score = float(engine.score[i, j])
+        for _ in range(k):
+            pairs.append((queues[i].popleft(), engine.types[i], queues[j].popleft(), engine.types[j], score))
+    unmatched = [(name, engine.types[i]) for i, q in enumerate(queues) for name in q]
+    return {
+        "pairs": pairs,
+        "total": total,
+        "upper_bound": upper,
+        "distribution": Counter(p[4] for p in pairs),
+        "unmatched": unmatched,
+    }
+
+
+def team_participants(participants, size, engine=None):
+    # k명 팀: 팀 안 모든 쌍의 점수 합을 크게 하는 유형 단위 그리디
+    # (k=2 는 pair_participants 로 푼다)
+    engine = engine or get_engine()
+    if size == 2:
+        result = pair_participants(participants, engine)
+        result["teams"] = [[(a, ta), (b, tb)] for a, ta, b, tb, _ in result["pairs"]]
+        result["team_scores"] = [p[4] for p in result["pairs"]]
+        return result
+
+    queues = _queues(participants, engine)
+    counts = [len(q) for q in queues]
+    score = engine.score
+    teams, team_scores = [], []
+    remaining = sum(counts)
+    while remaining:
+        members = []
+        # 가장 많이 남은 유형으로 시작
+        first = max(range(len(counts)), key=lambda i: (counts[i], -i))
+        members.append(first)
+        counts[first] -= 1
+        while len(members) < min(size, remaining):
+            nxt = max(
+                (j for j in range(len(counts)) if counts[j]),
+                key=lambda j: (sum(score[m, j] for m in members), counts[j], -j),
+            )
+            members.append(nxt)
+            counts[nxt] -= 1
+        remaining -= len(members)
+        teams.append([(queues[i].popleft(), engine.types[i]) for i in members])
+        team_scores.append(float(sum(score[a, b] for x, a in enumerate(members) for b in members[x + 1:])))
+
+    return {
+        "teams": teams,
+        "team_scores": team_scores,
+        "total": sum(team_scores),
+        "distribution": Counter(team_scores),
+        "unmatched": [],
+    }
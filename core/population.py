@@ -0,0 +1,153 @@
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.mbti import ALL_TYPES, get_engine
+
+# -----------------------------
+# 회원 전체 대상 궁합 추천 (top-k)
+# -----------------------------
+# 유형이 16개뿐이라 "유형별 순위"를 한 번 만들어 두고 재사용한다.
+# 사용자 A 의 top-k 는 (A 의 유형 순위를 따라가며) 각 유형의 앞쪽 사용자만 보면 되므로
+# 유형마다 먼저 나온 k+1 명만 기억하면 충분하다. → 메모리 O(16·k), 시간 O(N)
+#
+# 순위 기준: 점수 내림차순 → 상대 유형(ALL_TYPES 순서) → 파일에 먼저 나온 사용자
+
+OUTPUT_COLUMNS = ["user_id", "rank", "partner_id", "partner_mbti", "score", "norm"]
+
+
+def ranked_types(engine=None):
+    # 유형별 상대 유형 순위 (점수 내림차순, 동점이면 ALL_TYPES 순서)
+    engine = engine or get_engine()
+    order = np.arange(len(engine.types))
+    return [list(np.lexsort((order, -engine.score[i]))) for i in range(len(engine.types))]
+
+
+def read_members(path, chunksize=100_000, id_col="user_id", type_col="mbti"):
+    # CSV/Parquet 을 (user_id, mbti) 청크로 흘려보낸다
+    path = Path(path)
+    if path.suffix.lower() in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=[id_col, type_col]):
+            yield _clean(batch.to_pandas(), id_col, type_col)
+    else:
+        for df in pd.read_csv(path, usecols=[id_col, type_col], dtype=str, chunksize=chunksize):
+            yield _clean(df, id_col, type_col)
+
+
+def _clean(df, id_col, type_col):
+    df = df.rename(columns={id_col: "user_id", type_col: "mbti"})
+    df["user_id"] = df["user_id"].astype(str)
+    df["mbti"] = df["mbti"].astype(str).str.strip().str.upper()
+    return df[df["mbti"].isin(ALL_TYPES)]
+
+
+class PopulationMatcher:
+    def __init__(self, k=5, engine=None):
+        self.k = k
+        self.engine = engine or get_engine()
+        self.order = ranked_types(self.engine)
+        self.heads = [[] for _ in self.engine.types]  # 유형별 먼저 나온 k+1 명
+        self.counts = [0] * len(self.engine.types)
+        self._candidates = None
+
+    def add(self, df):
+        # 1차 패스: 유형별 앞쪽 사용자만 기억
+        limit = self.k + 1
+        for t, ids in df.groupby("mbti", sort=False)["user_id"]:
+            i = self.engine.index[t]
+            self.counts[i] += len(ids)
+            need = limit - len(self.heads[i])
+            if need > 0:
+                self.heads[i].extend(ids.iloc[:need])
+        self._candidates = None
+
+    def candidates(self):
+        # 유형별 후보 k+1 명 (본인이 끼어 있으면 나중에 빼고 k 명을 쓴다)
+        if self._candidates is None:
+            limit = self.k + 1
+            result = []
+            for i, order in enumerate(self.order):
+                cands = []
+                for j in order:
+                    for uid in self.heads[j]:
+                        cands.append((uid, self.engine.types[j], float(self.engine.score[i, j]), float(self.engine.norm[i, j])))
+                        if len(cands) == limit:
+                            break
+                    if len(cands) == limit:
+                        break
+                result.append(cands)
+            self._candidates = result
+        return self._candidates
+
+    def recommend(self, df):
+        # 2차 패스: 청크 단위로 결과 DataFrame 을 만든다
+        cands = self.candidates()
+        rows = []
+        for uid, t in zip(df["user_id"], df["mbti"]):
+            rank = 0
+            for pid, ptype, score, norm in cands[self.engine.index[t]]:
+                if pid == uid:
+                    continue
+                rank += 1
+                rows.append((uid, rank, pid, ptype, score, norm))
+                if rank == self.k:
+                    break
+        return pd.DataFrame(rows, columns=OUTPUT_COLUMNS)
+
+
+def top_k_partners(path, k=5, chunksize=100_000, id_col="user_id", type_col="mbti", theory=None):
+    # 파일을 두 번 읽는다: 유형별 후보 수집 → 사용자별 결과를 청크로 yield
+    matcher = PopulationMatcher(k, get_engine(theory))
+    for df in read_members(path, chunksize, id_col, type_col):
+        matcher.add(df)
+    for df in read_members(path, chunksize, id_col, type_col):
+        yield matcher.recommend(df)
+
+
+def write_results(chunks, out):
+    out = Path(out) if out != "-" else None
+    if out is not None and out.suffix.lower() in (".parquet", ".pq"):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        for df in chunks:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(out, table.schema)
+            writer.write_table(table)
+        if writer is not None:
+            writer.close()
+        return
+
+    first = True
+    for df in chunks:
+        if out is None:
+            df.to_csv(sys.stdout, index=False, header=first)
+        else:
+            df.to_csv(out, index=False, header=first, mode="w" if first else "a")
+        first = False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="회원 파일(user_id, mbti)로 사용자별 top-k 궁합 상대를 뽑습니다.")
+    parser.add_argument("input", help="CSV 또는 Parquet 파일")
+    parser.add_argument("-o", "--output", default="-", help="결과 파일 (.csv/.parquet, 기본: 표준출력)")
+    parser.add_argument("-k", type=int, default=5, help="사용자별 추천 수")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--id-col", default="user_id")
+    parser.add_argument("--type-col", default="mbti")
+    parser.add_argument("--theory", help="궁합 이론 id (data/theories.json, 기본: 기본 이론)")
+    args = parser.parse_args(argv)
+
+    chunks = top_k_partners(args.input, args.k, args.chunksize, args.id_col, args.type_col, args.theory)
+    write_results(chunks, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import heapq
+import math
+
+# -----------------------------
+# BM25 가중치 (키워드 → 질환 역색인)
+# -----------------------------
+# 질환 하나를 "문서", 키워드 하나를 "단어"로 본다.
+#  - 여러 질환에 흔한 키워드일수록 idf 가 낮고
+#  - 키워드가 많은 질환일수록 키워드 하나의 무게가 줄어든다 (길이 정규화)
+# 그래서 키워드 10개짜리 질환이 2개짜리 질환을 개수만으로 이기지 못한다.
+
+K1 = 1.2
+B = 0.75
+
+
+def bm25_postings(owners, doc_lengths, k1=K1, b=B):
+    # owners[패턴 id] = ((질환 번호, 등장 횟수), ...) → ((질환 번호, 가중치), ...)
+    # 질환 번호가 음수인 항목(응급 단어)은 점수에 넣지 않는다.
+    n_docs = len(doc_lengths)
+    avgdl = (sum(doc_lengths) / n_docs) if n_docs else 1.0
+    postings = []
+    for owner in owners:
+        docs = [(g, tf) for g, tf in owner if g >= 0]
+        df = len(docs)
+        idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        postings.append(tuple(
+            (g, idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * doc_lengths[g] / avgdl)))
+            for g, tf in docs
+        ))
+    return postings
+
+
+def top_k(scores, k, triage_of):
+    # {질환 번호: 점수} → 점수 내림차순, 동점이면 우선순위(triage) → 사전 순서
+    return heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], triage_of[item[0]], item[0]))
@@ -0,0 +1,139 @@
+import json
+from pathlib import Path
+
+from core.mbti import ALL_TYPES, LETTER_INDEX, CompatEngine
+
+# -----------------------------
+# 궁합 이론 파일 로더
+# -----------------------------
+# data/theories.json 의 이론마다 규칙 목록(또는 다른 이론의 가중 평균)을 읽어서
+# 시작할 때 한 번 16×16 점수/이유 표(CompatEngine)로 컴파일한다.
+# 화면에서 이론을 바꾸는 건 이미 만들어 둔 표를 고르는 dict 조회 한 번이다.
+#
+# 규칙 종류
+#   same      {"axis": "NS"}            그 축 글자가 같으면
+#   differ    {"axis": "TF"}            그 축 글자가 다르면
+#   both      {"letters": "NF"}         두 사람 모두 그 글자들을 가지면
+#   pairs     {"pairs": [["A", "B"]]}   목록의 조합이면 (양방향)
+#   same_type                           같은 유형이면
+# 모든 규칙에 points(더할 점수)와 reason(이유 문장)이 있다.
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+THEORIES_PATH = DATA_DIR / "theories.json"
+MAX_RULES = 64  # 이유 비트마스크가 uint64
+
+
+class TheoryError(ValueError):
+    pass
+
+
+def _axis(value, where):
+    if not isinstance(value, str) or len(value) != 2:
+        raise TheoryError(f"{where}: axis 는 'EI' 같은 두 글자여야 합니다")
+    a, b = value.upper()
+    if a not in LETTER_INDEX or LETTER_INDEX.get(b) != LETTER_INDEX[a] or a == b:
+        raise TheoryError(f"{where}: 같은 축의 두 글자가 아닙니다: {value}")
+    return LETTER_INDEX[a]
+
+
+def _rule(raw, where):
+    # 규칙 하나 → (종류, 인자, 점수, 이유). (종류, 인자) 가 같으면 같은 조건이다.
+    if not isinstance(raw, dict):
+        raise TheoryError(f"{where}: 객체여야 합니다")
+    kind = raw.get("kind")
+    points = raw.get("points")
+    reason = raw.get("reason")
+    if not isinstance(points, (int, float)) or isinstance(points, bool):
+        raise TheoryError(f"{where}: points 는 숫자여야 합니다")
+    if not isinstance(reason, str) or not reason:
+        raise TheoryError(f"{where}: reason 은 비어 있지 않은 문자열이어야 합니다")
+
+    if kind in ("same", "differ"):
+        arg = _axis(raw.get("axis"), where)
+    elif kind == "both":
+        letters = raw.get("letters")
+        if not isinstance(letters, str) or not letters or any(ch not in LETTER_INDEX for ch in letters.upper()):
+            raise TheoryError(f"{where}: letters 는 MBTI 글자들이어야 합니다")
+        arg = "".join(sorted(set(letters.upper())))
+    elif kind == "pairs":
+        pairs = raw.get("pairs")
+        if not isinstance(pairs, list) or not pairs:
+            raise TheoryError(f"{where}: pairs 목록이 없습니다")
+        arg = set()
+        for p in pairs:
+            if not (isinstance(p, list) and len(p) == 2 and all(t in ALL_TYPES for t in p)):
+                raise TheoryError(f"{where}: 알 수 없는 조합 {p}")
+            arg.add((p[0], p[1]))
+            arg.add((p[1], p[0]))
+        arg = frozenset(arg)
+    elif kind == "same_type":
+        arg = None
+    else:
+        raise TheoryError(f"{where}: 알 수 없는 규칙 종류 {kind!r}")
+    return kind, arg, float(points), reason
+
+
+def _blend(parts, rules_of, where):
+    # 이론별 규칙에 가중치를 곱해 하나로 합친다. 같은 조건은 점수를 더하고 첫 이유 문장을 쓴다.
+    if not isinstance(parts, dict) or not parts:
+        raise TheoryError(f"{where}: blend 는 {{이론 id: 가중치}} 여야 합니다")
+    merged = {}
+    for tid, weight in parts.items():
+        if tid not in rules_of:
+            raise TheoryError(f"{where}: 규칙으로 정의된 이론이 아닙니다: {tid}")
+        if not isinstance(weight, (int, float)) or isinstance(weight, bool) or weight <= 0:
+            raise TheoryError(f"{where}: {tid} 가중치는 양수여야 합니다")
+        for kind, arg, points, reason in rules_of[tid]:
+            key = (kind, arg)
+            if key in merged:
+                merged[key][2] += points * weight
+            else:
+                merged[key] = [kind, arg, points * weight, reason]
+    return [tuple(r) for r in merged.values()]
+
+
+def compile_theories(raw, source="theories.json", types=ALL_TYPES):
+    # 원본 → (기본 이론 id, {id: CompatEngine}) — 파일에 적힌 순서 그대로
+    if not isinstance(raw, dict) or not isinstance(raw.get("theories"), list):
+        raise TheoryError(f"{source}: theories 목록이 없습니다")
+    specs, rules_of = [], {}
+    for i, spec in enumerate(raw["theories"]):
+        where = f"{source}: theories[{i}]"
+        if not isinstance(spec, dict) or not isinstance(spec.get("id"), str) or not spec["id"]:
+            raise TheoryError(f"{where}: id 가 없습니다")
+        where = f"{where} ({spec['id']})"
+        if any(s["id"] == spec["id"] for s in specs):
+            raise TheoryError(f"{where}: id 가 중복됩니다")
+        if ("rules" in spec) == ("blend" in spec):
+            raise TheoryError(f"{where}: rules 와 blend 중 하나만 있어야 합니다")
+        if "rules" in spec:
+            if not isinstance(spec["rules"], list) or not spec["rules"]:
+                raise TheoryError(f"{where}: rules 목록이 비어 있습니다")
+            rules_of[spec["id"]] = [_rule(r, f"{where}.rules[{j}]") for j, r in enumerate(spec["rules"])]
+        specs.append(spec)
+
+    engines = {}
+    for spec in specs:
+        where = f"{source}: {spec['id']}"
+        rules = rules_of.get(spec["id"]) or _blend(spec["blend"], rules_of, where)
+        if len(rules) > MAX_RULES:
+            raise TheoryError(f"{where}: 규칙은 {MAX_RULES}개까지입니다")
+        engines[spec["id"]] = CompatEngine(
+            rules, types,
+            id=spec["id"], name=spec.get("name") or spec["id"], description=spec.get("description", ""),
+        )
+
+    default = raw.get("default", specs[0]["id"] if specs else None)
+    if default not in engines:
+        raise TheoryError(f"{source}: 기본 이론 {default!r} 이 없습니다")
+    return default, engines
+
+
+def load_theories(path=THEORIES_PATH, types=ALL_TYPES):
+    path = Path(path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+    except json.JSONDecodeError as e:
+        raise TheoryError(f"{path.name}: JSON 파싱 실패: {e}") from e
+    return compile_theories(raw, path.name, types)
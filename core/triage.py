@@ -0,0 +1,237 @@
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+from core import metrics, negation
+from core.cache import ResultCache
+from core.fuzzy import FuzzyIndex, decompose_indexed
+from core.kb import LiveKB
+from core.matcher import KeywordMatcher
+from core.rank import bm25_postings, top_k
+
+# -----------------------------
+# Helper data
+# -----------------------------
+# 모든 세션이 같이 읽는 표라 읽기 전용으로 둔다
+TRIAGE_INFO = MappingProxyType({
+    level: MappingProxyType(info) for level, info in {
+        1: {"label": "🚨 즉시 119 (혹은 응급실로 이동)", "color": "#ef4444"},
+        2: {"label": "⚠️ 오늘 중 응급실/야간진료 권장", "color": "#f59e0b"},
+        3: {"label": "⏱ 24–48시간 내 외래 방문 권장", "color": "#0ea5e9"},
+        4: {"label": "✅ 자가 처치 우선 + 경과 관찰", "color": "#22c55e"},
+    }.items()
+})
+
+# 증상/상태 사전은 data/*.json 에 있다 (키워드 매칭 → 우선순위, 응급처치, 진료과, 간단한 응급처치 팁)
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# -----------------------------
+# Matching logic
+# -----------------------------
+@metrics.timed("normalize", sample=16)
+def normalize(txt: str) -> str:
+    return re.sub(r"\s+", " ", txt.strip())
+
+
+# 모든 세션이 같이 쓰는 analyze() 결과 캐시. 키 = (사전 버전, 정규화된 텍스트)
+ANALYZE_CACHE = ResultCache(max_entries=10_000, max_bytes=32 * 1024 * 1024, ttl=3600.0)
+
+
+def data_version(conditions, emergency_words) -> str:
+    # 사전 내용이 바뀌면 버전도 바뀌어서 이전 캐시 항목은 더 이상 맞지 않는다
+    raw = json.dumps([[dict(c) for c in conditions], list(emergency_words)], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+# 오타 허용으로 걸린 키워드는 정확히 걸린 것보다 덜 믿는다
+FUZZY_WEIGHT = 0.7
+# "흉통은 없고" 처럼 부정된 키워드 (0 이면 점수·응급 판정에서 빠진다)
+NEGATED_WEIGHT = 0.0
+WEIGHTS = {"exact": 1.0, "fuzzy": FUZZY_WEIGHT, "negated": NEGATED_WEIGHT}
+# 오타 허용으로만 걸린 질환이 올릴 수 있는 가장 급한 우선순위 (혼자서는 1·2단계로 올리지 않는다)
+FUZZY_TRIAGE_CAP = 3
+
+
+class TriageEngine:
+    # 질환 목록 + 응급 단어 → 키워드 매처, BM25 역색인, 오타 색인을 한 번만 만들어 두고 재사용
+    def __init__(self, conditions, emergency_words, cache=ANALYZE_CACHE, max_results=10, fuzzy=True):
+        self.conditions = list(conditions)
+        self.emergency_words = list(emergency_words)
+        self.matcher = KeywordMatcher([c["keywords"] for c in self.conditions], self.emergency_words)
+        self.postings = bm25_postings(self.matcher.owners, [len(c["keywords"]) for c in self.conditions])
+        self.emergency_ids = frozenset(
+            pid for pid, owner in enumerate(self.matcher.owners) if any(g < 0 for g, _ in owner)
+        )
+        # 응급 단어로만 쓰이는 패턴은 오타 허용 없이 ("피가 멈추고" ≠ "피가 멈추지")
+        emergency_only = frozenset(pid for pid in self.emergency_ids if all(g < 0 for g, _ in self.matcher.owners[pid]))
+        self.fuzzy = FuzzyIndex(self.matcher.patterns, exact_only=emergency_only) if fuzzy else None
+        self.triage_of = [c["triage"] for c in self.conditions]
+        self.max_results = max_results
+        # 캐시 키의 앞부분: 사전 내용 + 결과를 바꾸는 엔진 설정 (같은 캐시를 다른 설정 엔진이 같이 써도 안 섞이게)
+        config = (fuzzy, max_results, FUZZY_WEIGHT, NEGATED_WEIGHT, FUZZY_TRIAGE_CAP, negation.LOOKAHEAD)
+        self.version = data_version(self.conditions, self.emergency_words) + ":" + hashlib.sha1(repr(config).encode()).hexdigest()[:8]
+        self.cache = cache
+
+    def match(self, user_text: str):
+        # 정규화된 텍스트에서 걸린 키워드 → "exact" / "fuzzy" / "negated"
+        hits = dict.fromkeys(self.matcher.find(user_text), "exact")
+        if self.fuzzy is not None:
+            hits.update(self.fuzzy.search(user_text, skip=hits.keys()))
+        if hits and negation.has_cue(user_text):
+            hits = self._match_negation(user_text)
+        return hits
+
+    def _match_negation(self, text: str):
+        # 부정 표현이 있을 때만: 키워드가 나온 자리마다 뒤를 확인해 긍정/부정을 센다
+        patterns = self.matcher.patterns
+        counts = {}
+        for pid, end in self.matcher.find_all(text):
+            neg = negation.negated(text[end + 1:end + 1 + negation.LOOKAHEAD], patterns[pid])
+            counts.setdefault(pid, [0, 0, 0, 0])[neg] += 1
+        if self.fuzzy is not None:
+            jamo, owner = decompose_indexed(text)
+            for pid, _, kind, stop in self.fuzzy.anchors(jamo):
+                end = owner[stop - 1]
+                neg = negation.negated(text[end + 1:end + 1 + negation.LOOKAHEAD], patterns[pid])
+                counts.setdefault(pid, [0, 0, 0, 0])[(0 if kind == "exact" else 2) + neg] += 1
+        return negation.classify(counts)
+
+    def score(self, hits):
+        # {패턴 id: "exact" | "fuzzy" | "negated"} → (상위 결과, 응급 단어 여부, 걸린 키워드, 가장 급한 우선순위)
+        # 걸린 키워드의 역색인만 따라가서, 걸린 질환만 점수를 더한다.
+        # 우선순위는 BM25 순위와 따로, 점수가 난 모든 질환(상위 k 개 밖 포함) 중 가장 급한 것으로 본다
+        # 단 정확히 걸린 키워드가 하나도 없는 질환은 FUZZY_TRIAGE_CAP 보다 급하게 보지 않는다
+        # 합치는 순서를 고정해 두면 어떤 순서로 찾았든 점수가 비트 단위로 같다
+        hits = sorted(hits.items())
+        # 응급 단어는 정확히 (부정 없이) 걸렸을 때만 — 오타 허용으로 1단계까지 올리지 않는다
+        emergency_hit = any(pid in self.emergency_ids and kind == "exact" for pid, kind in hits)
+        scores = {}
+        exact = set()
+        for pid, kind in hits:
+            factor = WEIGHTS[kind]
+            if not factor:
+                continue
+            for g, w in self.postings[pid]:
+                scores[g] = scores.get(g, 0.0) + w * factor
+                if kind == "exact":
+                    exact.add(g)
+        # 부동소수 오차로 같은 점수가 갈리지 않게 반올림
+        scores = {g: round(s, 6) for g, s in scores.items()}
+        results = tuple((s, self.conditions[g]) for g, s in top_k(scores, self.max_results, self.triage_of))
+        keywords = tuple((self.matcher.patterns[pid], kind) for pid, kind in hits)
+        urgent = min(
+            (self.triage_of[g] if g in exact else max(self.triage_of[g], FUZZY_TRIAGE_CAP) for g in scores),
+            default=None,
+        )
+        return results, emergency_hit, keywords, urgent
+
+    def _run(self, user_text: str):
+        user_text = normalize(user_text)
+        key = (self.version, user_text)
+        if self.cache is not None:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+
+        out = self.score(self.match(user_text))
+        if self.cache is not None:
+            # 질환 dict 는 공유 참조라 텍스트 + 결과 튜플 크기만 센다
+            size = sys.getsizeof(user_text) + 64 * (len(out[0]) + len(out[2]) + 1)
+            self.cache.put(key, out, size)
+        return out
+
+    @metrics.timed("analyze")
+    def assess(self, user_text: str):
+        # → (결과 목록, 응급 단어 여부, 가장 급한 우선순위) — decide(..., urgent=) 에 그대로 넘긴다
+        results, emergency_hit, keywords, urgent = self._run(user_text)
+        if metrics.ENABLED:
+            metrics.record_keywords(keywords)
+        return list(results), emergency_hit, urgent
+
+    def analyze(self, user_text: str):
+        results, emergency_hit, _ = self.assess(user_text)
+        return results, emergency_hit
+
+    def matched_keywords(self, user_text: str):
+        # [(키워드, "exact" | "fuzzy" | "negated")] — 화면에서 "비슷한 말로 찾았어요" 안내용
+        return list(self._run(user_text)[2])
+
+
+def _build_engine(kb):
+    return TriageEngine(kb.conditions, kb.emergency_words)
+
+
+def _drop_old_results(old, new):
+    ANALYZE_CACHE.discard(lambda key: key[0] == old.version)
+
+
+# 파일이 바뀌면 알아서 다시 읽는 사전: 기본(test.py) / 벌 쏘임 추가(test1.py)
+BASE_KB = LiveKB(DATA_DIR / "conditions.json", build=_build_engine, levels=tuple(TRIAGE_INFO), on_reload=_drop_old_results)
+EXTENDED_KB = LiveKB(
+    DATA_DIR / "conditions.json", DATA_DIR / "conditions_extra.json",
+    build=_build_engine, levels=tuple(TRIAGE_INFO), on_reload=_drop_old_results,
+)
+
+# 시작 시점의 사전 (읽기 전용 튜플)
+CONDITIONS = BASE_KB.kb.conditions
+EMERGENCY_BONUS_WORDS = BASE_KB.kb.emergency_words
+EXTRA_CONDITIONS = EXTENDED_KB.kb.conditions[len(CONDITIONS):]
+ENGINE = BASE_KB.engine()
+
+
+def current_engine() -> TriageEngine:
+    return BASE_KB.engine()
+
+
+def extended_engine() -> TriageEngine:
+    return EXTENDED_KB.engine()
+
+
+def analyze(user_text: str):
+    return current_engine().analyze(user_text)
+
+
+def decide(results, emergency_hit, record=True, urgent=None):
+    # analyze()/assess() 결과 → (대표 후보, 최종 우선순위, 찾아갈 곳)
+    # 대표 후보는 BM25 점수 순서로 고르지만, 최종 우선순위는 걸린 질환 중 가장 급한 것이다.
+    # 증상을 하나 더 적었다고 (예: "흉통이 있고 코피가 나요") 1단계가 4단계로 내려가면 안 된다.
+    # urgent 는 assess() 가 준 값 (상위 결과 밖 질환까지 본 것), 없으면 결과 목록에서 구한다.
+    # record=False 는 입력 중 미리보기처럼 계측에 세지 않을 때
+    if not results:
+        # 질환은 못 찾았어도 응급 단어("경련 후 의식이 없어요")가 있으면 응급실로 보낸다
+        if not emergency_hit:
+            return [], None, None
+        if record and metrics.ENABLED:
+            metrics.record_decision([], 1, True)
+        return [], 1, "응급실"
+    top_score = results[0][0]
+    picks = [c for s, c in results if s == top_score][:3]
+
+    final_triage = min(c["triage"] for _, c in results) if urgent is None else urgent
+    if all(c["triage"] != final_triage for c in picks):
+        # 가장 급한 질환이 대표 후보에 없으면 순위가 가장 높은 것을 함께 보여 준다
+        driver = next((c for _, c in results if c["triage"] == final_triage), None)
+        if driver is not None:
+            picks.append(driver)
+    overridden = emergency_hit and final_triage > 1
+    if overridden:
+        final_triage = 1
+    if record and metrics.ENABLED:
+        metrics.record_decision(picks, final_triage, overridden)
+
+    if final_triage == 1:
+        base = "응급실"
+    elif final_triage == 2:
+        base = "응급실 야간진료"
+    elif final_triage == 3:
+        depts = {}
+        for c in picks:
+            if c["triage"] == final_triage:
+                depts[c["dept"]] = depts.get(c["dept"], 0) + 1
+        base = max(depts, key=depts.get) if depts else picks[0]["dept"]
+    else:
+        base = picks[0]["dept"]
+    return picks, final_triage, base
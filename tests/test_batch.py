@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from core.batch import run
+
+RECORDS = [
+    '{"id": 1, "text": "흉통이 있어요"}',
+    "{bad json",
+    '["x"]',
+    '{"id": 4, "text": 123}',
+    {"id": 5, "text": "코피가 나요"},
+]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_bad_records_are_rejected_not_fatal(workers):
+    out = list(run(RECORDS, workers=workers, batch_size=2))
+    lines = [json.loads(line) for chunk, _, _ in out for line in chunk.splitlines()]
+    assert sum(rejects for _, rejects, _ in out) == 3
+    assert sum(size for _, _, size in out) == len(RECORDS)
+    # 입력 순서 그대로 한 줄씩
+    assert [line.get("id") for line in lines] == [1, None, None, 4, 5]
+    assert [("error" in line) for line in lines] == [False, True, True, True, False]
+    assert lines[0]["triage"] == 1
+    assert lines[4]["triage"] == 4
@@ -0,0 +1,57 @@
+import pytest
+
+from core.fuzzy import FuzzyIndex
+from core.triage import BASE_KB, EXTENDED_KB, TriageEngine, decide
+
+ENGINES = [TriageEngine(kb.kb.conditions, kb.kb.emergency_words, cache=None) for kb in (BASE_KB, EXTENDED_KB)]
+
+
+def assess(engine, text):
+    results, emergency_hit, urgent = engine.assess(text)
+    return decide(results, emergency_hit, record=False, urgent=urgent)[1]
+
+
+# 진짜 오타 — 여전히 걸린다
+@pytest.mark.parametrize("text, keyword", [
+    ("흉퉁", "흉통"),
+    ("골졀", "골절"),
+    ("골젏", "골절"),
+    ("흉퉁이 있어요", "흉통"),
+])
+@pytest.mark.parametrize("engine", ENGINES, ids=["base", "extended"])
+def test_typos_still_match(engine, text, keyword):
+    assert dict(engine.matched_keywords(text))[keyword] == "fuzzy"
+
+
+# 비슷하지만 다른 말 — 초성이 다르거나 한 글자 어절이 바뀌면 오타로 보지 않는다
+@pytest.mark.parametrize("text", ["마음 아픔", "딴 소리 하지마", "뜨거운 국"])
+@pytest.mark.parametrize("engine", ENGINES, ids=["base", "extended"])
+def test_near_miss_words_do_not_match(engine, text):
+    assert engine.matched_keywords(text) == []
+    assert assess(engine, text) is None
+
+
+@pytest.mark.parametrize("engine", ENGINES, ids=["base", "extended"])
+def test_fuzzy_only_match_never_drives_triage_1_or_2(engine):
+    # "흉통" 은 1단계지만 오타로만 걸렸으면 3단계까지만
+    assert assess(engine, "흉퉁") == 3
+    assert assess(engine, "흉퉁이 있고 흉통도 있어요") == 1
+
+
+def test_spacing_only_counts_as_exact():
+    engine = ENGINES[0]
+    assert dict(engine.matched_keywords("가슴 통증"))["가슴통증"] == "exact"
+    assert assess(engine, "가슴 통증") == 1
+    assert dict(engine.matched_keywords("가슴 통증은 없어요"))["가슴통증"] == "negated"
+
+
+@pytest.mark.parametrize("text, found", [
+    ("뜨거운물", {0: "exact"}),   # 띄어쓰기만 다름
+    ("뜨거은 물", {0: "fuzzy"}),
+    ("뜨거운 몰", {}),             # 한 글자 어절
+    ("드거운 물", {}),             # 초성
+    ("뜨기온 물", {}),             # 한 어절에 두 번
+])
+def test_syllable_budget(text, found):
+    index = FuzzyIndex(["뜨거운 물"])
+    assert index.search(text) == found
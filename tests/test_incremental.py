@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from bench.corpus import keywords
+from core.incremental import IncrementalAnalyzer
+from core.triage import BASE_KB, EXTENDED_KB, TriageEngine, normalize
+
+PIECES = [
+    "흉퉁", "골젏", "가슴 통증", "숨쉬기 힘듦", "벌에 쏘였", "코피가", "어", "아파요", "그리고 ",
+    "  ", "\n", "\t ", " ",
+    "은 없고 ", "는 안 ", " 안 멈춰요", "아니고", "은 아닌 ", "없어요.", "않아 ",
+    "을 수 없어요", "지 않아요", "없지 않아", "사라지지 ",
+]
+
+
+def summary(out):
+    results, emergency_hit, matched, urgent = out
+    return [(s, c["name"]) for s, c in results], emergency_hit, matched, urgent
+
+
+@pytest.mark.parametrize("kb", [BASE_KB, EXTENDED_KB], ids=["base", "extended"])
+def test_random_edits_match_full_analysis(kb):
+    engine = TriageEngine(kb.kb.conditions, kb.kb.emergency_words, cache=None)
+    pieces = keywords() + PIECES
+    rnd = random.Random(0)
+    for _ in range(60):
+        live = IncrementalAnalyzer(engine)
+        text = ""
+        for _ in range(30):
+            op = rnd.random()
+            if op < 0.5 or not text:
+                pos = len(text) if rnd.random() < 0.6 else rnd.randint(0, len(text))
+                text = text[:pos] + rnd.choice(pieces) + text[pos:]
+            elif op < 0.8:
+                i = rnd.randint(0, len(text))
+                text = text[:i] + text[i + rnd.randint(1, 5):]
+            else:
+                i = rnd.randint(0, len(text))
+                text = text[:i] + rnd.choice(pieces) + text[i + rnd.randint(0, 4):]
+            live.update(text)
+            assert live.normalized() == normalize(text)
+            assert summary(live._scored()) == summary(engine._run(text)), text
+
+
+def test_edit_out_of_range():
+    live = IncrementalAnalyzer(BASE_KB.engine(), "흉통")
+    with pytest.raises(IndexError):
+        live.edit(1, 5, "")
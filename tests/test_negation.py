@@ -0,0 +1,77 @@
+import pytest
+
+from core.negation import negated
+from core.triage import BASE_KB, TriageEngine, decide
+
+ENGINE = TriageEngine(BASE_KB.kb.conditions, BASE_KB.kb.emergency_words, cache=None)
+
+# (입력, 최종 우선순위, 응급 단어 여부)
+CASES = [
+    ("흉통은 없고 코피가 나요", 4, False),
+    ("흉통이 있고 숨이 차요", 1, False),
+    ("가슴통증은 전혀 없어요", None, False),
+    ("흉통은 아녜요", None, False),
+    ("화상은 아닌 것 같은데 손목이 부었어요", 3, False),
+    ("코피가 안 멈춰요", 4, False),
+    # 부정처럼 보이지만 증상이 있다는 뜻 — 빠뜨리면 안 된다
+    ("가슴통증을 참을 수 없어요", 1, False),
+    ("호흡곤란으로 말을 할 수 없어요", 1, True),
+    ("흉통이 사라지지 않아요", 1, False),
+    ("가슴통증이 없어지지 않아요", 1, False),
+    ("흉통이 없지 않아요", 1, False),
+    ("흉통이 있지는 않아요", 1, False),
+    # 응급 단어는 오타 허용으로 걸리지 않는다
+    ("코피가 조금 나요 피가 멈추고 나서 괜찮아요", 4, False),
+    ("의식 저녁에", None, False),
+    # 부정어가 키워드가 아닌 다른 말을 받는 경우 — 키워드는 그대로 남는다
+    ("경련 후 의식이 없어요", 1, True),
+    ("가슴통증 때문에 잠이 안 와요", 1, False),
+    ("흉통 때문에 밥을 안 먹었어요", 1, False),
+    ("왼팔 마비 감각이 없어요", 1, True),
+    ("호흡곤란 증상이 안 좋아요", 1, True),
+    ("흉통 말고는 별 문제 없어요", 1, False),
+]
+
+
+@pytest.mark.parametrize("text, triage, emergency", CASES)
+def test_triage_with_negation(text, triage, emergency):
+    results, emergency_hit = ENGINE.analyze(text)
+    _, final_triage, _ = decide(results, emergency_hit, record=False)
+    assert final_triage == triage
+    assert emergency_hit == emergency
+
+
+@pytest.mark.parametrize("text, keyword, kind", [
+    ("흉통은 없고 코피가 나요", "흉통", "negated"),
+    ("흉통은 없고 코피가 나요", "코피", "exact"),
+    ("화상은 아닌 것 같은데 손목이 부었어요", "화상", "negated"),
+    ("흉퉁은 없어요", "흉통", "negated"),
+    ("흉통은 없고, 오늘 또 흉통이 있어요", "흉통", "exact"),
+    ("경련 후 의식이 없어요", "경련", "exact"),
+    ("가슴통증 때문에 잠이 안 와요", "가슴통증", "exact"),
+    ("흉통 말고는 별 문제 없어요", "흉통", "exact"),
+])
+def test_keyword_kind(text, keyword, kind):
+    assert dict(ENGINE.matched_keywords(text))[keyword] == kind
+
+
+@pytest.mark.parametrize("following", [
+    "은 없어요", "이 아니에요", "은 아닌 것 같아요", "는 안 나요",
+    "은 전혀 없어요", "도 별로 없어요", " 없음", "는 전혀 안 나요",
+])
+def test_negated(following):
+    assert negated(following, "흉통")
+
+
+@pytest.mark.parametrize("following", [
+    "이 심해요", "이 있는데 두통은 없어요", "을 참을 수 없어요", "이 사라지지 않아요",
+    "이 없지 않아요", "가 안 멈춰요", "이 있고, 호흡은 괜찮아요 없어요",
+    " 때문에 잠이 안 와요", " 말고는 별 문제 없어요", " 후 의식이 없어요", " 증상이 안 좋아요",
+    "이 없어지지 않아요", "이랑 두통은 아니에요", "이 안에서",
+])
+def test_not_negated(following):
+    assert not negated(following, "흉통")
+
+
+def test_keyword_ending_in_ji_is_never_negated():
+    assert not negated(" 않아요", "피가 멈추지")
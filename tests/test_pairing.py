@@ -0,0 +1,62 @@
+import random
+import time
+from functools import lru_cache
+
+import pytest
+
+from core.mbti import ALL_TYPES, get_theories
+from core.pairing import pair_participants
+
+THEORIES = get_theories()[1]
+
+
+def brute_force(types, engine):
+    # 사람 단위 비트마스크 DP — 작은 그룹의 정답
+    n = len(types)
+    idx = [engine.index[t] for t in types]
+
+    @lru_cache(maxsize=None)
+    def best(mask):
+        i = next((k for k in range(n) if not mask >> k & 1), None)
+        if i is None:
+            return 0.0
+        mask |= 1 << i
+        out = best(mask) if (n - bin(mask).count("1")) % 2 == 0 else float("-inf")
+        for j in range(i + 1, n):
+            if not mask >> j & 1:
+                out = max(out, float(engine.score[idx[i], idx[j]]) + best(mask | 1 << j))
+        return out
+
+    return best(0)
+
+
+def actual_total(result, engine):
+    return sum(float(engine.score[engine.index[a], engine.index[b]]) for _, a, _, b, _ in result["pairs"])
+
+
+@pytest.mark.parametrize("theory", list(THEORIES))
+def test_small_groups_match_brute_force(theory):
+    engine = THEORIES[theory]
+    rnd = random.Random(theory)
+    for _ in range(60):
+        pool = ALL_TYPES[:rnd.randint(2, 16)]
+        types = [rnd.choice(pool) for _ in range(rnd.randint(2, 11))]
+        result = pair_participants([(str(i), t) for i, t in enumerate(types)], engine)
+        total = actual_total(result, engine)
+        assert result["total"] == pytest.approx(total)
+        assert total == pytest.approx(brute_force(tuple(types), engine))
+        assert len(result["pairs"]) == len(types) // 2
+        assert len(result["unmatched"]) == len(types) % 2
+
+
+@pytest.mark.parametrize("theory", list(THEORIES))
+def test_large_group_is_fast_and_within_upper_bound(theory):
+    engine = THEORIES[theory]
+    rnd = random.Random(0)
+    people = [(str(i), rnd.choice(ALL_TYPES)) for i in range(5000)]
+    start = time.perf_counter()
+    result = pair_participants(people, engine)
+    assert time.perf_counter() - start < 5
+    assert result["total"] == pytest.approx(actual_total(result, engine))
+    assert result["total"] <= result["upper_bound"] + 1e-9
+    assert len(result["pairs"]) == 2500
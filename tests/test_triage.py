@@ -0,0 +1,43 @@
+import pytest
+
+from core.triage import BASE_KB, TriageEngine, decide
+
+ENGINE = TriageEngine(BASE_KB.kb.conditions, BASE_KB.kb.emergency_words, cache=None)
+
+
+def triage_of(text):
+    results, emergency_hit, urgent = ENGINE.assess(text)
+    return decide(results, emergency_hit, record=False, urgent=urgent)
+
+
+# 증상을 하나 더 적었다고 급한 질환이 묻히면 안 된다 (BM25 는 표시 순서만 정한다)
+@pytest.mark.parametrize("text, triage, dest", [
+    ("흉통이 있고 코피가 나요", 1, "응급실"),
+    ("가슴통증이 있고 멍이 들었어요", 1, "응급실"),
+    ("코피가 나요", 4, None),
+    ("발목 접질림", 3, None),
+])
+def test_most_urgent_match_decides_triage(text, triage, dest):
+    picks, final_triage, base = triage_of(text)
+    assert final_triage == triage
+    assert any(c["triage"] == triage for c in picks)
+    if dest is not None:
+        assert base == dest
+
+
+def test_extra_symptom_never_downgrades():
+    _, alone, _ = triage_of("흉통이 있어요")
+    for extra in ("코피가 나요", "멍이 들었어요", "발목을 삐었어요", "손목이 부었어요"):
+        _, mixed, _ = triage_of(f"흉통이 있고 {extra}")
+        assert mixed <= alone
+
+
+def test_display_order_follows_bm25():
+    results, _, _ = ENGINE.assess("흉통이 있고 코피가 나요")
+    scores = [s for s, _ in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_analyze_without_urgent_uses_all_results():
+    results, emergency_hit = ENGINE.analyze("흉통이 있고 코피가 나요")
+    assert decide(results, emergency_hit, record=False)[1] == 1
@@ -0,0 +1 @@
+# Streamlit 화면 코드
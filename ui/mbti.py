@@ -0,0 +1,124 @@
+import streamlit as st
+import pandas as pd
+from core import metrics
+from core.mbti import ALL_TYPES, get_engine, get_theories
+from core.pairing import parse_participants, team_participants
+
+MODES = ("💖 1:1 추천", "👥 그룹 매칭")
+TABLE_COLUMNS = ("상대 MBTI", "점수(원점수)", "적합도(%)", "이유")
+
+
+@st.cache_resource
+def ranked_frame(your: str, theory: str):
+    # 전체 순위표 DataFrame — (이론, 유형)별로 프로세스에 한 번만 만들고 모든 세션이 같은 객체를 쓴다.
+    # cache_data 와 달리 꺼낼 때마다 복사하지 않으므로 받은 쪽에서 고치면 안 된다 (st.dataframe 은 읽기만 함)
+    with metrics.stage("dataframe"):
+        return pd.DataFrame(list(get_engine(theory).ranked(your)), columns=list(TABLE_COLUMNS))
+
+
+@st.fragment
+@metrics.timed("render_recommendations")
+def recommendations(your: str, theory: str):
+    # 슬라이더/토글을 움직이면 이 조각만 다시 그린다 (미리 정렬된 순위표를 잘라 쓰기만 함)
+    c1, c2 = st.columns([3, 1])
+    with c1:
+        top_k = st.slider("✨ 추천 개수 ✨", 1, 10, 5)
+    with c2:
+        show_all = st.toggle("📜 전체 순위표 보기", value=False)
+
+    for t, score, norm, reason in get_engine(theory).ranked(your, top_k):
+        with st.container(border=True):
+            st.markdown(f"## 🧩💖 {t} · 🌈 적합도 {norm}% 💖🧩")
+            st.progress(min(int(norm), 100))
+            with st.expander("✨🔍 이 궁합을 이렇게 본 이유 🔍✨"):
+                st.write(reason)
+
+    if show_all:
+        st.divider()
+        st.subheader("📊🌟 전체 순위표 🌟📊")
+        st.dataframe(ranked_frame(your, theory), use_container_width=True)
+
+
+@st.fragment
+@metrics.timed("render_group_matching")
+def group_matching(theory: str):
+    # 참가자 입력이 바뀌어도 이 조각만 다시 그린다
+    st.subheader("👥💞 그룹 매칭 💞👥")
+    st.caption("참가자 전체의 궁합 점수 합이 가장 커지도록 짝(또는 팀)을 만들어요 ✨")
+    team_size = st.number_input("👥 팀 인원 (2 = 1:1 짝)", min_value=2, max_value=10, value=2)
+    upload = st.file_uploader("📂 참가자 CSV (이름, MBTI)", type=["csv"])
+    text = st.text_area("✍️ 또는 한 줄에 한 명씩 ‘이름 MBTI’", height=160, placeholder="민지 ENFP\n서준 INTJ\n하린 ISFJ")
+
+    if upload is not None:
+        members = pd.read_csv(upload, dtype=str).iloc[:, :2].dropna()
+        text = "\n".join(f"{a} {b}" for a, b in members.itertuples(index=False))
+    people, bad = parse_participants(text)
+    if bad:
+        st.warning(f"MBTI를 읽지 못한 줄 {len(bad)}개는 제외했어요: " + ", ".join(bad[:5]))
+
+    if len(people) >= 2:
+        result = team_participants(people, int(team_size), engine=get_engine(theory))
+        c1, c2, c3 = st.columns(3)
+        c1.metric("👥 참가자", len(people))
+        c2.metric("💞 팀 수", len(result["teams"]))
+        c3.metric("🌈 총점", result["total"])
+        if "upper_bound" in result and result["upper_bound"] > result["total"]:
+            st.caption(f"이론상 상한: {result['upper_bound']}")
+
+        with metrics.stage("dataframe"):
+            team_df = pd.DataFrame({
+                "팀": [i + 1 for i in range(len(result["teams"]))],
+                "멤버": [" · ".join(f"{n}({t})" for n, t in team) for team in result["teams"]],
+                "점수": result["team_scores"],
+            })
+        st.dataframe(team_df, use_container_width=True, hide_index=True)
+
+        st.markdown("**📊 점수 분포**")
+        dist = pd.Series(result["distribution"]).sort_index()
+        st.bar_chart(pd.DataFrame({"팀 수": dist.values}, index=dist.index.astype(str)))
+
+        if result["unmatched"]:
+            st.info("짝이 없는 참가자: " + ", ".join(f"{n}({t})" for n, t in result["unmatched"]))
+    else:
+        st.markdown("> 🌟 참가자를 두 명 이상 입력하면 매칭 결과가 나와요!")
+
+
+@metrics.timed("render_page")
+def run():
+    # MBTI 궁합 추천 화면
+    st.set_page_config(
+        page_title="🌈💖✨ MBTI 궁합 추천기 ✨💖🌈",
+        page_icon="💞",
+        layout="centered",
+    )
+
+    st.title("🌟💘 MBTI 궁합 추천기 💘🌟")
+    st.caption("🌸 이 앱은 가볍게 즐기는 재미용! 다양한 이론 중 하나를 반영해 귀엽게 추천해드려요 💫✨")
+
+    with st.sidebar:
+        st.header("⚙️🌟 설정 🌟⚙️")
+        mode = st.radio("🎯 모드", MODES, horizontal=True)
+        if mode == MODES[0]:
+            your = st.selectbox("💖 나의 MBTI를 선택하세요 💖", ALL_TYPES, index=ALL_TYPES.index("ENFP") if "ENFP" in ALL_TYPES else 0)
+        # 이론마다 점수표를 시작할 때 만들어 두어서, 바꾸면 표만 갈아 끼운다
+        default, engines = get_theories()
+        ids = list(engines)
+        theory = st.selectbox("📚 궁합 이론", ids, index=ids.index(default), format_func=lambda t: engines[t].name)
+        st.caption(engines[theory].description)
+
+    if mode == MODES[0]:
+        st.subheader("🔮💫✨ 추천 결과 ✨💫🔮")
+        recommendations(your, theory)
+    else:
+        group_matching(theory)
+
+    st.divider()
+    st.markdown(
+        """
+        ⚠️ **주의/면책** ⚠️  
+        본 앱은 과학적 진단 도구가 아니라, 🌸 **재미로 보는 가벼운 추천** 🌸 을 제공합니다! ✨  
+        관계는 MBTI뿐 아니라 💕 가치관, 🌍 소통 방식, 🎶 삶의 맥락 등 다양한 요소로 만들어져요 🌟.
+        """
+    )
+
+    st.caption("👉 좌측 사이드바에서 ✨ MBTI와 궁합 이론을, 추천 결과 위에서 💕 추천 개수와 전체 순위표를 바꿔가며 다양한 조합을 확인해보세요! 🌈")
@@ -0,0 +1,158 @@
+import streamlit as st
+from urllib.parse import quote_plus
+from datetime import datetime
+
+from core import metrics
+from core.audit import get_audit
+from core.facilities import get_finder
+from core.incremental import IncrementalAnalyzer
+from core.triage import TRIAGE_INFO, current_engine, decide
+
+
+@metrics.timed("render_page")
+def run(get_engine=current_engine):
+    # 응급처치 · 진료안내 화면 (test.py / test1.py 공용)
+    # 사전 파일이 바뀌면 다음 실행부터 새 엔진을 받도록 매번 get_engine() 으로 꺼낸다
+    # -----------------------------
+    # Page config
+    # -----------------------------
+    st.set_page_config(
+        page_title="응급처치 · 진료안내 도우미",
+        page_icon="🩹",
+        layout="wide"
+    )
+
+    # -----------------------------
+    # UI
+    # -----------------------------
+    with st.sidebar:
+        st.markdown("""
+        # 🩹 응급처치 · 진료안내 도우미
+
+        증상이나 다친 부위를 적으면 **우선 해야 할 응급처치**와 **권장 진료과/이동 여부**를 안내해요.
+
+        **중요 고지**
+        - 본 앱은 학습/참고용 정보입니다. 실제 진료를 대체하지 않아요.
+        - **심한 통증, 호흡곤란, 의식 변화** 등 위험 신호가 보이면 즉시 **119**에 연락하세요.
+        """)
+
+    # 메인 화면 제목/캡션
+    st.title("🆘 내 증상에 맞는 응급처치와 진료과 안내")
+    st.caption("입력 예: ‘가슴이 조여오고 왼팔로 통증이 퍼지면서 식은땀이 나요’ · ‘뜨거운 물에 데였고 물집이 생겼어요’ · ‘발목을 접질렀어요’")
+
+    # 사용자 입력 영역 (입력 중에는 이 조각만 다시 그린다)
+    input_panel(get_engine)
+
+    # 결과 영역: ‘분석하기’로 제출된 입력이 있을 때만
+    submitted = st.session_state.get("triage_input")
+    if submitted is not None:
+        result_panel(get_engine, *submitted)
+    else:
+        st.markdown(
+            "> ⚡ 증상을 입력하고 ‘분석하기’를 누르면 결과가 표시됩니다. 자주 겪는 상황(골절, 화상, 코피 등)에 대한 응급처치 팁도 함께 제공돼요."
+        )
+
+
+@st.fragment
+@metrics.timed("render_input")
+def input_panel(get_engine):
+    # 글자를 입력하거나 지역을 바꿔도 결과 패널은 그대로 두고 이 부분만 다시 그린다
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        text = st.text_area("어디가 아픈가요/어떻게 다쳤나요?", height=160, placeholder="증상, 발생 상황, 동반 증상 등을 적어주세요.")
+    with col2:
+        loc = st.text_input("지역/동네 (선택)", placeholder="예: 서울 강남역, 부산 서면")
+        st.write("")
+        st.markdown("**오늘 날짜**: " + datetime.now().strftime("%Y-%m-%d %H:%M"))
+
+    # 입력 중 미리보기: 세션마다 분석기를 들고 있다가 바뀐 부분만 다시 본다
+    # st.text_area 는 글자마다가 아니라 입력창을 벗어나거나 Ctrl+Enter 를 눌렀을 때만 값을 보낸다
+    live_preview(get_engine(), text)
+    st.caption("💡 예상 결과는 입력창 밖을 누르거나 Ctrl+Enter(⌘+Enter)를 누르면 바뀌어요.")
+
+    # 분석 버튼: 제출한 입력을 기억해 두고 결과 패널까지 한 번 다시 그린다
+    if st.button("🔎 분석하기"):
+        st.session_state["triage_input"] = (text, loc)
+        st.rerun()
+
+
+def live_preview(engine, text):
+    live = st.session_state.get("triage_live")
+    if live is None or live.engine is not engine:
+        # 처음이거나 사전이 다시 읽혀서 엔진이 바뀌었으면 새로 만든다
+        live = st.session_state["triage_live"] = IncrementalAnalyzer(engine)
+    live.update(text)
+    results, emergency_hit, urgent = live.assess()
+    picks, final_triage, _ = decide(results, emergency_hit, record=False, urgent=urgent)
+    if final_triage is not None:
+        names = ", ".join(c["name"] for c in picks)
+        st.caption(f"✍️ 지금까지 적은 내용으로 예상: {TRIAGE_INFO[final_triage]['label']} · {names}")
+
+
+@metrics.timed("render_result")
+def result_panel(get_engine, text, loc):
+    if not text.strip():
+        st.warning("증상을 먼저 입력해 주세요.")
+    else:
+        engine = get_engine()
+        results, emergency_hit, urgent = engine.assess(text)
+        picks, final_triage, base = decide(results, emergency_hit, urgent=urgent)
+        # 품질 검토용 기록: 큐에 넣기만 하고 바로 돌아온다
+        get_audit().record(text, picks, final_triage, base, loc)
+        if final_triage is None:
+            st.info("명확한 매칭이 없어요. 그래도 위험 신호가 있으면 119에 연락하세요. 증상을 조금 더 구체적으로 적어주세요.")
+        else:
+            tri = TRIAGE_INFO[final_triage]
+            st.markdown(f"""
+            <div style='padding:14px;border-radius:14px;border:2px solid {tri['color']};'>
+                <div style='font-size:1.1rem'>우선순위</div>
+                <div style='font-weight:700;color:{tri['color']};font-size:1.3rem'>{tri['label']}</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.subheader("🔍 가능한 원인(추정)")
+            keywords = engine.matched_keywords(text)
+            fuzzy = [k for k, kind in keywords if kind == "fuzzy"]
+            if fuzzy:
+                st.caption("🔤 오타를 감안해 비슷한 말로 찾았어요: " + ", ".join(fuzzy))
+            negated = [k for k, kind in keywords if kind == "negated"]
+            if negated:
+                st.caption("🚫 '없다/아니다'로 적은 증상은 빼고 봤어요: " + ", ".join(negated))
+            for c in picks:
+                with st.expander(f"{c['name']} · 권장: {c['dept']} · 우선순위: {TRIAGE_INFO[c['triage']]['label']}"):
+                    st.markdown("**응급처치 가이드**")
+                    for step in c["first_aid"]:
+                        st.markdown(f"- {step}")
+                    if "simple_tip" in c:
+                        st.markdown("**👉 내가 할 수 있는 간단한 응급처치**")
+                        st.info(c["simple_tip"])
+                    if "red_flags" in c:
+                        st.markdown("**위험 신호 (보이면 즉시 병원)**")
+                        st.markdown(", ".join(c["red_flags"]))
+
+            # 진료과/장소 안내
+            st.subheader("🏥 어디로 가야 하나요?")
+            nearby = get_finder().find(loc, final_triage, base) if loc.strip() else None
+            if nearby is not None and nearby[1]:
+                place, found = nearby
+                st.markdown(f"**📍 {place} 근처 {base}**")
+                for f, km in found:
+                    tags = " · ".join(t for t, on in (("응급실", f.er), ("야간진료", f.night)) if on)
+                    st.markdown(f"- **{f.name}** · {km:.1f}km" + (f" · {tags}" if tags else ""))
+                st.caption("지도 앱에서 더 찾아보기 👇")
+            # 지명을 모르거나 더 찾아보고 싶을 때는 지도 검색 링크
+            query = base if not loc.strip() else f"{loc} {base}"
+            naver = f"https://map.naver.com/p/search/{quote_plus(query)}"
+            kakao = f"https://map.kakao.com/?q={quote_plus(query)}"
+            google = f"https://www.google.com/maps/search/{quote_plus(query)}"
+            st.markdown(
+                f"[🧭 네이버지도에서 검색하기]({naver}) · [🗺 카카오맵에서 검색하기]({kakao}) · [🌎 구글지도에서 검색하기]({google})"
+            )
+
+            st.divider()
+            st.markdown("""
+            ### ℹ️ 참고 안내
+            - 이 도구는 **전문의 진단을 대체하지 않습니다**. 
+            - 약 복용, 알레르기, 지병이 있다면 반드시 의료진에게 알리세요.
+            - 아동/임신부/고령자는 동일 증상이라도 **더 낮은 역치로 병원 방문**이 필요합니다.
+            """)